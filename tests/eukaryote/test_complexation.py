@@ -6,12 +6,12 @@
 :License: MIT
 """
 
+from scipy.constants import Avogadro
 from wc_model_gen.eukaryote import complexation
 from wc_onto import onto as wc_ontology
 from wc_utils.util.units import unit_registry
 import wc_model_gen.global_vars as gvar
 import os
-import scipy.constants
 import shutil
 import tempfile
 import unittest
@@ -19,19 +19,26 @@ import wc_kb
 import wc_lang
 import wc_model_gen.utils as utils
 
+MOLECULE_PER_MOL_UNITS = unit_registry.parse_units('molecule mol^-1')
+G_PER_L_UNITS = unit_registry.parse_units('g l^-1')
+L_UNITS = unit_registry.parse_units('l')
+MOLECULE_UNITS = unit_registry.parse_units('molecule')
+NORMAL_DISTRIBUTION = wc_ontology['WC:normal_distribution']
+
 
 class TestCase(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
 
         # Create KB content
-        self.tmp_dirname = tempfile.mkdtemp()
-        self.sequence_path = os.path.join(self.tmp_dirname, 'test_seq.fasta')
-        with open(self.sequence_path, 'w') as f:
+        cls.tmp_dirname = tempfile.mkdtemp()
+        cls.sequence_path = os.path.join(cls.tmp_dirname, 'test_seq.fasta')
+        with open(cls.sequence_path, 'w') as f:
             f.write('>chr1\nGCGTGCGATGATtgatga\n')
 
-        self.kb = wc_kb.KnowledgeBase()
-        cell = self.kb.cell = wc_kb.Cell()
+        cls._kb = wc_kb.KnowledgeBase()
+        cell = cls._kb.cell = wc_kb.Cell()
 
         nucleus = cell.compartments.create(id='n')
         mito = cell.compartments.create(id='m')
@@ -39,7 +46,7 @@ class TestCase(unittest.TestCase):
         membrane = cell.compartments.create(id='c_m')
         cytoplasm = cell.compartments.create(id='c')
 
-        chr1 = wc_kb.core.DnaSpeciesType(cell=cell, id='chr1', sequence_path=self.sequence_path)
+        chr1 = wc_kb.core.DnaSpeciesType(cell=cell, id='chr1', sequence_path=cls.sequence_path)
         gene1 = wc_kb.eukaryote.GeneLocus(cell=cell, id='gene1', polymer=chr1, start=1, end=18)
         
         locus1 = wc_kb.eukaryote.GenericLocus(start=1, end=6)
@@ -109,101 +116,86 @@ class TestCase(unittest.TestCase):
             ])                    
 
         # Create initial model content
-        self.model = model = wc_lang.Model()
+        cls._model = model = wc_lang.Model()
         
-        model.parameters.create(id='Avogadro', value = scipy.constants.Avogadro,
-                                units = unit_registry.parse_units('molecule mol^-1'))
+        model.parameters.create(id='Avogadro', value = Avogadro,
+                                units = MOLECULE_PER_MOL_UNITS)
 
         compartments = {'n': ('nucleus', 5E-14), 'm': ('mitochondria', 2.5E-14), 
             'l': ('lysosome', 2.5E-14), 'c_m': ('membrane', 5E-15), 'c': ('cytoplasm', 1E-13)}
         for k, v in compartments.items():
-            init_volume = wc_lang.core.InitVolume(distribution=wc_ontology['WC:normal_distribution'], 
+            init_volume = wc_lang.core.InitVolume(distribution=NORMAL_DISTRIBUTION, 
                     mean=v[1], std=0)
             c = model.compartments.create(id=k, name=v[0], init_volume=init_volume)
             c.init_density = model.parameters.create(id='density_' + k, value=1000, 
-                units=unit_registry.parse_units('g l^-1'))
-            volume = model.functions.create(id='volume_' + k, units=unit_registry.parse_units('l'))
+                units=G_PER_L_UNITS)
+            volume = model.functions.create(id='volume_' + k, units=L_UNITS)
             volume.expression, error = wc_lang.FunctionExpression.deserialize(f'{c.id} / {c.init_density.id}', {
                 wc_lang.Compartment: {c.id: c},
                 wc_lang.Parameter: {c.init_density.id: c.init_density},
                 })
             assert error is None, str(error)
 
+        model_compartments = {c.id: c for c in model.compartments}
+        model_species_types = {}
+
         for i in cell.species_types.get(__type=wc_kb.eukaryote.ProteinSpeciesType):
-            model_species_type = model.species_types.get_or_create(id=i.id, name=i.name, type=wc_ontology['WC:protein'])
-            model_compartment = model.compartments.get_one(id='n')
-            model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_compartment)
+            model_species_type = model_species_types[i.id] = model.species_types.create(
+                id=i.id, name=i.name, type=wc_ontology['WC:protein'])
+            model_species = model.species.create(species_type=model_species_type, compartment=model_compartments['n'])
             model_species.id = model_species.gen_id()
-            conc_model = model.distribution_init_concentrations.get_or_create(species=model_species, 
-                mean=10, units=unit_registry.parse_units('molecule'))
+            conc_model = model.distribution_init_concentrations.create(species=model_species, 
+                mean=10, units=MOLECULE_UNITS)
             conc_model.id = conc_model.gen_id()
 
-        model_species_type = model.species_types.get_or_create(id='prot3', name='protein3', type=wc_ontology['WC:protein'])
-        model_mito = model.compartments.get_one(id='m')
-        model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_mito)
-        model_species.id = model_species.gen_id()
-        conc_model = model.distribution_init_concentrations.create(species=model_species, 
-            mean=20, units=unit_registry.parse_units('molecule'))
-        conc_model.id = conc_model.gen_id()        
-        
-        model_membrane = model.compartments.get_one(id='c_m')
-        model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_membrane)
-        model_species.id = model_species.gen_id()
-        conc_model = model.distribution_init_concentrations.create(species=model_species, 
-            mean=20, units=unit_registry.parse_units('molecule'))
-        conc_model.id = conc_model.gen_id()
-
-        model_species_type = model.species_types.get_or_create(id='prot4', name='protein4', type=wc_ontology['WC:protein'])
-        model_cyto = model.compartments.get_one(id='c')
-        model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_cyto)
-        model_species.id = model_species.gen_id()
-        conc_model = model.distribution_init_concentrations.create(species=model_species, 
-            mean=20, units=unit_registry.parse_units('molecule'))
-        conc_model.id = conc_model.gen_id()
+        for species_type_id, compartment_id in [('prot3', 'm'), ('prot3', 'c_m'), ('prot4', 'c')]:
+            model_species = model.species.create(species_type=model_species_types[species_type_id],
+                compartment=model_compartments[compartment_id])
+            model_species.id = model_species.gen_id()
+            conc_model = model.distribution_init_concentrations.create(species=model_species, 
+                mean=20, units=MOLECULE_UNITS)
+            conc_model.id = conc_model.gen_id()
 
         for i in cell.species_types.get(__type=wc_kb.eukaryote.TranscriptSpeciesType):
-            model_species_type = model.species_types.get_or_create(id=i.id, name=i.name, type=wc_ontology['WC:RNA'])
-            model_compartment = model.compartments.get_one(id='c')
-            model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_compartment)
+            model_species_type = model.species_types.create(id=i.id, name=i.name, type=wc_ontology['WC:RNA'])
+            model_species = model.species.create(species_type=model_species_type, compartment=model_compartments['c'])
             model_species.id = model_species.gen_id()
-            conc_model = model.distribution_init_concentrations.get_or_create(species=model_species, 
-                mean=25, units=unit_registry.parse_units('molecule'))
+            conc_model = model.distribution_init_concentrations.create(species=model_species, 
+                mean=25, units=MOLECULE_UNITS)
             conc_model.id = conc_model.gen_id()
 
-        model_species_type = model.species_types.get_or_create(id='met1', name='metabolite1', type=wc_ontology['WC:metabolite'])
+        model_species_type = model.species_types.create(id='met1', name='metabolite1', type=wc_ontology['WC:metabolite'])
         for compartment in model.compartments:
-            model_species = model.species.get_or_create(species_type=model_species_type, compartment=compartment)
+            model_species = model.species.create(species_type=model_species_type, compartment=compartment)
             model_species.id = model_species.gen_id()
 
         for compl in [complex1, complex2, complex3, complex4]:
             model_species_type = model.species_types.create(id=compl.id, type=wc_ontology['WC:pseudo_species'])
-            subunit_compartments = [[s.compartment.id for s in sub.species_type.species]
+            subunit_compartments = [set(s.compartment.id for s in sub.species_type.species)
                 for sub in compl.subunits]
-            if len(subunit_compartments) == 1:
-                shared_compartments = set(subunit_compartments[0])
-            else:    
-                shared_compartments = set([])
-                for i in range(len(subunit_compartments)):
-                    shared_compartments = (set(subunit_compartments[i])
-                        if i==0 else shared_compartments).intersection(
-                        set(subunit_compartments[i+1]) if i<(len(subunit_compartments)-1) else shared_compartments)            
-            compartment_ids = set(list(shared_compartments))
-            for compartment_id in compartment_ids:
-                model_compartment = model.compartments.get_one(id=compartment_id)
-                model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_compartment)
+            shared_compartments = set.intersection(*subunit_compartments) if subunit_compartments else set()
+            for compartment_id in shared_compartments:
+                model_species = model.species.create(species_type=model_species_type,
+                    compartment=model_compartments[compartment_id])
                 model_species.id = model_species.gen_id()
 
         metabolic_participants = ['amp', 'cmp', 'gmp', 'ump', 'h2o', 'h', 'Ala', 'Cys', 'Asp', 'Glu', 'Selcys']
         metabolic_compartments = ['l', 'm', 'c']
         for i in metabolic_participants:
+            model_species_type = model.species_types.create(id=i, type=wc_ontology['WC:metabolite'])
             for c in metabolic_compartments:
-                model_species_type = model.species_types.get_or_create(id=i, type=wc_ontology['WC:metabolite'])            
-                model_compartment = model.compartments.get_one(id=c)
-                model_species = model.species.get_or_create(species_type=model_species_type, compartment=model_compartment)
+                model_species = model.species.create(species_type=model_species_type, compartment=model_compartments[c])
                 model_species.id = model_species.gen_id()
-            
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dirname)
+
+    def setUp(self):
+        self.kb = self._kb.copy()
+        self.model = self._model.copy()
+
     def tearDown(self):
-        shutil.rmtree(self.tmp_dirname)
         gvar.protein_aa_usage = {}
         gvar.transcript_ntp_usage = {}                     
 
@@ -227,6 +219,9 @@ class TestCase(unittest.TestCase):
             })
         gen.run()
 
+        reactions = {rxn.id: rxn for rxn in model.reactions}
+        parameters = {param.id: param for param in model.parameters}
+
         self.assertEqual(gvar.protein_aa_usage['prot4'], 
             {'A': 0, 'C': 0, 'D': 1, 'E': 0, 'U': 1, 'len': 2, '*': 2, 'start_aa': 'D', 'start_codon': 'GAU'})
         self.assertEqual(gvar.transcript_ntp_usage['trans5'], {'A': 1, 'C': 2, 'G': 1, 'U': 0, 'len': 4})       
@@ -236,65 +231,65 @@ class TestCase(unittest.TestCase):
         self.assertEqual(model.submodels.get_one(id='complexation').framework, wc_ontology['WC:next_reaction_method'])
 
         # Test gen_reaction
-        complex1_assembly = model.reactions.get_one(id='complex_1_association_in_n')
+        complex1_assembly = reactions['complex_1_association_in_n']
         self.assertEqual(complex1_assembly.name, 'Complexation of complex_1 in nucleus')
         self.assertEqual(complex1_assembly.reversible, False)
         self.assertEqual(complex1_assembly.comments, '')
         self.assertEqual([(i.species.id, i.coefficient) for i in complex1_assembly.participants],
             [('prot1[n]', -1), ('prot2[n]', -2), ('prot3[n]', -1), ('complex_1[n]', 1)])
         
-        dissociate_prot1 = model.reactions.get_one(id='complex_1_dissociation_in_n_degrade_prot1')
+        dissociate_prot1 = reactions['complex_1_dissociation_in_n_degrade_prot1']
         self.assertEqual(dissociate_prot1.name, 'Dissociation of complex_1 in nucleus and degradation of prot1')
         self.assertEqual(dissociate_prot1.reversible, False)
         self.assertEqual(dissociate_prot1.comments, '')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in dissociate_prot1.participants]),
-            sorted([('complex_1[n]', -1), ('h2o[l]', -1), ('Ala[l]', 1), ('Cys[l]', 1), ('prot2[n]', 2), ('prot3[n]', 1)]))
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in dissociate_prot1.participants],
+            [('complex_1[n]', -1), ('h2o[l]', -1), ('Ala[l]', 1), ('Cys[l]', 1), ('prot2[n]', 2), ('prot3[n]', 1)])
         
-        dissociate_prot2 = model.reactions.get_one(id='complex_1_dissociation_in_n_degrade_prot2')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in dissociate_prot2.participants]),
-            sorted([('complex_1[n]', -1), ('h2o[l]', -1), ('Cys[l]', 1), ('Asp[l]', 1), ('prot1[n]', 1), ('prot2[n]', 1), ('prot3[n]', 1)]))
+        dissociate_prot2 = reactions['complex_1_dissociation_in_n_degrade_prot2']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in dissociate_prot2.participants],
+            [('complex_1[n]', -1), ('h2o[l]', -1), ('Cys[l]', 1), ('Asp[l]', 1), ('prot1[n]', 1), ('prot2[n]', 1), ('prot3[n]', 1)])
 
-        dissociate_prot3 = model.reactions.get_one(id='complex_1_dissociation_in_n_degrade_prot3')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in dissociate_prot3.participants]),
-            sorted([('complex_1[n]', -1), ('h2o[l]', -1), ('Asp[l]', 2), ('prot1[n]', 1), ('prot2[n]', 2)]))
+        dissociate_prot3 = reactions['complex_1_dissociation_in_n_degrade_prot3']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in dissociate_prot3.participants],
+            [('complex_1[n]', -1), ('h2o[l]', -1), ('Asp[l]', 2), ('prot1[n]', 1), ('prot2[n]', 2)])
 
-        complex2_assembly = model.reactions.get_one(id='complex_2_association_in_m')
+        complex2_assembly = reactions['complex_2_association_in_m']
         self.assertEqual(complex2_assembly.name, 'Complexation of complex_2 in mitochondria')
         self.assertEqual(complex2_assembly.reversible, False)
         self.assertEqual(complex2_assembly.comments, '')
         self.assertEqual([(i.species.id, i.coefficient) for i in complex2_assembly.participants],
             [('prot3[m]', -2), ('met1[m]', -2), ('complex_2[m]', 1)])
 
-        c2_dissociate_prot3_m = model.reactions.get_one(id='complex_2_dissociation_in_m_degrade_prot3')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c2_dissociate_prot3_m.participants]),
-            sorted([('complex_2[m]', -1), ('h2o[m]', -1), ('Asp[m]', 2),  ('prot3[m]', 1), ('met1[m]', 2)]))
+        c2_dissociate_prot3_m = reactions['complex_2_dissociation_in_m_degrade_prot3']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c2_dissociate_prot3_m.participants],
+            [('complex_2[m]', -1), ('h2o[m]', -1), ('Asp[m]', 2),  ('prot3[m]', 1), ('met1[m]', 2)])
 
-        c2_dissociate_prot3_c_m = model.reactions.get_one(id='complex_2_dissociation_in_c_m_degrade_prot3')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c2_dissociate_prot3_c_m.participants]),
-            sorted([('complex_2[c_m]', -1), ('h2o[l]', -1), ('Asp[l]', 2),  ('prot3[c_m]', 1), ('met1[c_m]', 2)]))
+        c2_dissociate_prot3_c_m = reactions['complex_2_dissociation_in_c_m_degrade_prot3']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c2_dissociate_prot3_c_m.participants],
+            [('complex_2[c_m]', -1), ('h2o[l]', -1), ('Asp[l]', 2),  ('prot3[c_m]', 1), ('met1[c_m]', 2)])
 
-        dissociate_prot4 = model.reactions.get_one(id='complex_3_dissociation_in_n_degrade_prot4')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in dissociate_prot4.participants]),
-            sorted([('complex_3[n]', -1), ('h2o[l]', -1), ('Asp[l]', 1), ('Selcys[l]', 1), ('prot4[n]', 1)]))
+        dissociate_prot4 = reactions['complex_3_dissociation_in_n_degrade_prot4']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in dissociate_prot4.participants],
+            [('complex_3[n]', -1), ('h2o[l]', -1), ('Asp[l]', 1), ('Selcys[l]', 1), ('prot4[n]', 1)])
 
-        complex4_assembly = model.reactions.get_one(id='complex_4_association_in_c')
+        complex4_assembly = reactions['complex_4_association_in_c']
         self.assertEqual(complex4_assembly.name, 'Complexation of complex_4 in cytoplasm')
         self.assertEqual([(i.species.id, i.coefficient) for i in complex4_assembly.participants],
             [('prot4[c]', -1), ('trans5[c]', -1), ('trans6[c]', -2), ('complex_4[c]', 1)])
 
-        c4_dissociate_prot4_c = model.reactions.get_one(id='complex_4_dissociation_in_c_degrade_prot4')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c4_dissociate_prot4_c.participants]),
-            sorted([('complex_4[c]', -1), ('h2o[l]', -1), ('Asp[l]', 1), ('Selcys[l]', 1), ('trans5[c]', 1), ('trans6[c]', 2)]))
+        c4_dissociate_prot4_c = reactions['complex_4_dissociation_in_c_degrade_prot4']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c4_dissociate_prot4_c.participants],
+            [('complex_4[c]', -1), ('h2o[l]', -1), ('Asp[l]', 1), ('Selcys[l]', 1), ('trans5[c]', 1), ('trans6[c]', 2)])
 
-        c4_dissociate_trans5_c = model.reactions.get_one(id='complex_4_dissociation_in_c_degrade_trans5')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c4_dissociate_trans5_c.participants]),
-            sorted([('complex_4[c]', -1), ('h2o[c]', -3), ('amp[c]', 1), ('cmp[c]', 2), ('gmp[c]', 1), ('ump[c]', 0), ('h[c]', 3), 
-                ('prot4[c]', 1), ('trans6[c]', 2)]))
+        c4_dissociate_trans5_c = reactions['complex_4_dissociation_in_c_degrade_trans5']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c4_dissociate_trans5_c.participants],
+            [('complex_4[c]', -1), ('h2o[c]', -3), ('amp[c]', 1), ('cmp[c]', 2), ('gmp[c]', 1), ('ump[c]', 0), ('h[c]', 3), 
+                ('prot4[c]', 1), ('trans6[c]', 2)])
 
-        c4_dissociate_trans6_c = model.reactions.get_one(id='complex_4_dissociation_in_c_degrade_trans6')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c4_dissociate_trans6_c.participants]),
-            sorted([('complex_4[c]', -1), ('h2o[c]', -1), ('amp[c]', 1), ('cmp[c]', 0), ('gmp[c]', 0), ('ump[c]', 1), ('h[c]', 1), 
-                ('prot4[c]', 1), ('trans5[c]', 1), ('trans6[c]', 1)]))              
+        c4_dissociate_trans6_c = reactions['complex_4_dissociation_in_c_degrade_trans6']
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c4_dissociate_trans6_c.participants],
+            [('complex_4[c]', -1), ('h2o[c]', -1), ('amp[c]', 1), ('cmp[c]', 0), ('gmp[c]', 0), ('ump[c]', 1), ('h[c]', 1), 
+                ('prot4[c]', 1), ('trans5[c]', 1), ('trans6[c]', 1)])              
 
         # Test gen_rate_laws
         self.assertEqual(complex1_assembly.rate_laws[0].expression.expression, 
@@ -319,20 +314,20 @@ class TestCase(unittest.TestCase):
             self.assertEqual(law.validate(), None)
 
         # Test calibrate_submodels
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_1_association_in_n_prot1').value, 10/scipy.constants.Avogadro/5E-14)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_1_association_in_n_prot3').value, 10/scipy.constants.Avogadro/5E-14)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_1_association_in_n_prot3').comments, 
+        self.assertEqual(parameters['K_m_complex_1_association_in_n_prot1'].value, 10/Avogadro/5E-14)
+        self.assertEqual(parameters['K_m_complex_1_association_in_n_prot3'].value, 10/Avogadro/5E-14)
+        self.assertEqual(parameters['K_m_complex_1_association_in_n_prot3'].comments, 
             'The value was assumed to be 1.0 times the concentration of prot3 in nucleus')        
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_association_in_n').value, (1/40000 + 2/20000 + 1/25000)/0.1)
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_association_in_n').comments,
+        self.assertEqual(parameters['k_cat_complex_1_association_in_n'].value, (1/40000 + 2/20000 + 1/25000)/0.1)
+        self.assertEqual(parameters['k_cat_complex_1_association_in_n'].comments,
             'The value was assigned so that the ratio of effective dissociation constant to '
             'association constant is the same as the specified ratio of free subunit to subunit in complexes '
             'at equilibrium') 
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_dissociation_in_n_degrade_prot1').value, 1/40000.)
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_dissociation_in_n_degrade_prot2').value, 2/20000.)
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_dissociation_in_n_degrade_prot3').value, 1/25000.)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_4_association_in_c_trans5').value, 25/scipy.constants.Avogadro/1E-13)
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_4_dissociation_in_c_degrade_trans6').value, 2/36000.)
+        self.assertEqual(parameters['k_cat_complex_1_dissociation_in_n_degrade_prot1'].value, 1/40000.)
+        self.assertEqual(parameters['k_cat_complex_1_dissociation_in_n_degrade_prot2'].value, 2/20000.)
+        self.assertEqual(parameters['k_cat_complex_1_dissociation_in_n_degrade_prot3'].value, 1/25000.)
+        self.assertEqual(parameters['K_m_complex_4_association_in_c_trans5'].value, 25/Avogadro/1E-13)
+        self.assertEqual(parameters['k_cat_complex_4_dissociation_in_c_degrade_trans6'].value, 2/36000.)
 
         # Test determine_initial_concentration
         gen.options['estimate_initial_state'] = True
@@ -361,13 +356,13 @@ class TestCase(unittest.TestCase):
         self.assertEqual(model.distribution_init_concentrations.get_one(id='dist-init-conc-complex_2[c_m]').mean, 9)
         self.assertEqual(model.distribution_init_concentrations.get_one(id='dist-init-conc-complex_3[n]').mean, 4.5)
         
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_1_association_in_n').value, (1/40000 + 2/20000 + 1/25000) * 4)
-        self.assertEqual(model.parameters.get_one(id='k_cat_complex_2_association_in_n').value, 2/25000 * 2.5)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_1_association_in_n_prot1').value, 6/scipy.constants.Avogadro/5E-14)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_1_association_in_n_prot1').comments, 
+        self.assertEqual(parameters['k_cat_complex_1_association_in_n'].value, (1/40000 + 2/20000 + 1/25000) * 4)
+        self.assertEqual(parameters['k_cat_complex_2_association_in_n'].value, 2/25000 * 2.5)
+        self.assertEqual(parameters['K_m_complex_1_association_in_n_prot1'].value, 6/Avogadro/5E-14)
+        self.assertEqual(parameters['K_m_complex_1_association_in_n_prot1'].comments, 
             'The value was assumed to be 1.0 times the concentration of prot1 in nucleus')
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_2_association_in_m_met1').value, 1e-05)
-        self.assertEqual(model.parameters.get_one(id='K_m_complex_2_association_in_m_met1').comments, 
+        self.assertEqual(parameters['K_m_complex_2_association_in_m_met1'].value, 1e-05)
+        self.assertEqual(parameters['K_m_complex_2_association_in_m_met1'].comments, 
             'The value was assigned to 1e-05 because the concentration of met1 in mitochondria was not known')
 
     def test_global_vars(self):
@@ -392,10 +387,10 @@ class TestCase(unittest.TestCase):
         gen.run()   
 
         dissociate_prot1 = self.model.reactions.get_one(id='complex_1_dissociation_in_n_degrade_prot1')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in dissociate_prot1.participants]),
-            sorted([('complex_1[n]', -1), ('h2o[l]', -6), ('Ala[l]', 4), ('Cys[l]', 2), ('Asp[l]', 1), ('prot2[n]', 2), ('prot3[n]', 1)]))
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in dissociate_prot1.participants],
+            [('complex_1[n]', -1), ('h2o[l]', -6), ('Ala[l]', 4), ('Cys[l]', 2), ('Asp[l]', 1), ('prot2[n]', 2), ('prot3[n]', 1)])
         
         c4_dissociate_trans6_c = self.model.reactions.get_one(id='complex_4_dissociation_in_c_degrade_trans6')
-        self.assertEqual(sorted([(i.species.id, i.coefficient) for i in c4_dissociate_trans6_c.participants]),
-            sorted([('complex_4[c]', -1), ('h2o[c]', -3), ('amp[c]', 0), ('cmp[c]', 1), ('gmp[c]', 1), ('ump[c]', 2), ('h[c]', 3), 
-                ('prot4[c]', 1), ('trans5[c]', 1), ('trans6[c]', 1)]))
+        self.assertCountEqual([(i.species.id, i.coefficient) for i in c4_dissociate_trans6_c.participants],
+            [('complex_4[c]', -1), ('h2o[c]', -3), ('amp[c]', 0), ('cmp[c]', 1), ('gmp[c]', 1), ('ump[c]', 2), ('h[c]', 3), 
+                ('prot4[c]', 1), ('trans5[c]', 1), ('trans6[c]', 1)])
@@ -491,3 +491,74 @@ class TranscriptionSubmodelGeneratorTestCase(unittest.TestCase):
             'The value was assigned to 1e-05 because the concentration of utp in mitochondria was zero')
         self.assertEqual(self.model.parameters.get_one(id='k_cat_transcription_elongation_trans2').comments, 
             'Set to the median value because it could not be determined from data')
+
+    def test_calibrate_submodel_zero_denominators(self):
+
+        gen = transcription.TranscriptionSubmodelGenerator(self.kb, self.model, options={
+            'transcription_unit': {'trans6': ['trans7', 'trans8']},
+            'rna_pol_pair': {'trans1': 'RNA Polymerase I', 'trans2': 'RNA Polymerase mitochondria', 
+                            'trans3': 'RNA Polymerase II', 'trans4': 'RNA Polymerase II', 
+                            'trans5': 'RNA Polymerase III', 'trans6': 'RNA Polymerase II'},
+            'init_factors': {'pol1_init_factors': [['pol1_init_factor1']],
+                             'pol2_init_factors': [['pol2_init_factor1']],
+                             'pol3_init_factors': [['pol3_init_factor1']],
+                             'polm_init_factors': [['polm_init_factor1']]},
+            'elongation_termination_factors': {'pol1_el_factors': [['pol1_el_factor1']],
+                                               'pol2_el_factors': [['pol2_el_factor1']],
+                                               'pol3_el_factors': [['pol3_el_factor1']],
+                                               'polm_el_factors': [['polm_el_factor1']]},
+            'elongation_negative_factors': {'pol2_neg_factors': [['pol2_neg_factor1']]},
+            'rna_init_factors': {'trans1': 'pol1_init_factors', 'trans2': 'polm_init_factors', 
+                                'trans3': 'pol2_init_factors', 'trans4': 'pol2_init_factors', 
+                                'trans5': 'pol3_init_factors', 'trans6': 'pol2_init_factors'},
+            'rna_elongation_termination_factors': {'trans1': 'pol1_el_factors', 'trans2': 'polm_el_factors', 
+                                                    'trans3': 'pol2_el_factors', 'trans4': 'pol2_el_factors', 
+                                                    'trans5': 'pol3_el_factors', 'trans6': 'pol2_el_factors'},
+            'rna_elongation_negative_factors': {'trans1': '', 'trans2': '', 
+                                                'trans3': 'pol2_neg_factors', 'trans4': 'pol2_neg_factors', 
+                                                'trans5': '', 'trans6': 'pol2_neg_factors'},                  
+            'polr_occupancy_width': 2,
+            'ribosome_occupancy_width': 4,                
+            })
+        gen.gen_reactions()
+        gen.gen_rate_laws()
+
+        # No free or non-specifically bound RNA Polymerase I, and no chance of binding the mitochondrial gene
+        model = self.model
+        model.distribution_init_concentrations.get_one(id='dist-init-conc-complex1[n]').mean = 0.
+        model.distribution_init_concentrations.get_one(
+            id='dist-init-conc-complex1_bound_non_specific_site[n]').mean = 0.
+        model.parameters.get_one(id='total_mitochondrial_genome_binding').value = float('inf')
+
+        gen.calibrate_submodel()
+
+        self.assertEqual(model.parameters.get_one(id='k_non_specific_binding_complex1').value, 0.)
+        self.assertEqual(model.parameters.get_one(id='k_non_specific_binding_complex1').comments, 
+            'The value was assigned to 0 because the concentration of free RNA Polymerase I in nucleus was zero')
+        self.assertEqual(model.parameters.get_one(id='k_specific_binding_complex1').value, 0.)
+        self.assertEqual(model.parameters.get_one(id='k_specific_binding_complex1').comments, 
+            'The value was assigned to 0 because the concentration of non-specifically bound RNA Polymerase I '
+            'or the probability of binding its genes in nucleus was zero')
+        self.assertEqual(model.parameters.get_one(id='k_non_specific_binding_complex3').value, 
+            math.log(2)*(1/(20*3600) + 1/15000)*10/75)
+        self.assertEqual(model.parameters.get_one(id='k_specific_binding_complex3').value, 0.)
+        self.assertEqual(model.parameters.get_one(id='k_specific_binding_complex3').comments, 
+            'The value was assigned to 0 because the concentration of non-specifically bound RNA Polymerase mitochondria '
+            'or the probability of binding its genes in mitochondria was zero')
+        self.assertEqual(model.distribution_init_concentrations.get_one(
+            id='dist-init-conc-complex3_bound_gene2[m]').mean, 0.)
+        self.assertEqual(model.parameters.get_one(id='k_cat_transcription_elongation_trans2').comments, 
+            'Set to the median value because it could not be determined from data')
+
+        for param in model.parameters:
+            if param.value is not None:
+                self.assertFalse(math.isnan(param.value), param.id)
+        for conc in model.distribution_init_concentrations:
+            if conc.mean is not None:
+                self.assertFalse(math.isnan(conc.mean), conc.id)
+
+    def test_count_ntps(self):
+        self.assertEqual(transcription.count_ntps('ACGUuaNnA'), {'A': 3, 'C': 1, 'G': 1, 'U': 2, 'len': 9})
+        self.assertEqual(transcription.count_ntps('ACGUuaNnA', bases='ACGUN'),
+            {'A': 3, 'C': 1, 'G': 1, 'U': 2, 'N': 2, 'len': 9})
+        self.assertEqual(transcription.count_ntps(''), {'A': 0, 'C': 0, 'G': 0, 'U': 0, 'len': 0})
@@ -0,0 +1,65 @@
+""" Cached knowledge base fixtures for the prokaryote tests
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Author: Ashwin Srinivasan <ashwins@mit.edu>
+:Author: Yin Hoon Chew <yinhoon.chew@mssm.edu>
+:Date: 2018-06-11
+:Copyright: 2018, Karr Lab
+:License: MIT
+"""
+
+from test.support import EnvironmentVarGuard
+from wc_model_gen import prokaryote
+import functools
+import wc_kb
+
+CORE_PATH = 'tests/fixtures/min_model_kb.xlsx'
+SEQ_PATH = 'tests/fixtures/min_model_seq.fna'
+
+
+@functools.lru_cache(maxsize=None)
+def _read_kb(core_path, seq_path):
+    """ Read a knowledge base once per pair of fixture paths
+
+    Args:
+        core_path (:obj:`str`): path to the core of the knowledge base
+        seq_path (:obj:`str`): path to the genome sequence of the knowledge base
+
+    Returns:
+        :obj:`wc_kb.KnowledgeBase`: pristine knowledge base; must not be mutated
+    """
+    env = EnvironmentVarGuard()
+    env.set('CONFIG__DOT__wc_kb__DOT__io__DOT__strict', '0')
+    with env:
+        return wc_kb.io.Reader().run(core_path, seq_path)[wc_kb.KnowledgeBase][0]
+
+
+def load_kb(core_path=CORE_PATH, seq_path=SEQ_PATH):
+    """ Get a copy of a cached knowledge base
+
+    Args:
+        core_path (:obj:`str`, optional): path to the core of the knowledge base
+        seq_path (:obj:`str`, optional): path to the genome sequence of the knowledge base
+
+    Returns:
+        :obj:`wc_kb.KnowledgeBase`: knowledge base
+    """
+    return _read_kb(core_path, seq_path).copy()
+
+
+def gen_model(kb, component_generators, options=None):
+    """ Generate a model with :obj:`prokaryote.ProkaryoteModelGenerator`
+
+    Args:
+        kb (:obj:`wc_kb.KnowledgeBase`): knowledge base
+        component_generators (:obj:`list` of :obj:`wc_model_gen.ModelComponentGenerator`): model
+            component generators to run after :obj:`prokaryote.InitalizeModel`
+        options (:obj:`dict`, optional): options of :obj:`prokaryote.ProkaryoteModelGenerator`
+
+    Returns:
+        :obj:`wc_lang.Model`: model
+    """
+    return prokaryote.ProkaryoteModelGenerator(
+        knowledge_base=kb,
+        component_generators=[prokaryote.InitalizeModel] + list(component_generators),
+        options=options).run()
@@ -17,7 +17,6 @@ import numpy as np
 import shutil
 import tempfile
 import unittest
-import wc_kb_gen
 import wc_lang
 import wc_kb
 import os
@@ -5,7 +5,6 @@ import shutil
 import tempfile
 import unittest
 import wc_kb
-import wc_kb_gen
 import wc_lang
 
 
@@ -7,7 +7,6 @@
 """
 
 from test.support import EnvironmentVarGuard
-import wc_kb_gen
 from wc_model_gen import prokaryote
 import unittest
 import wc_lang
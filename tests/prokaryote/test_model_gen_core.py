@@ -6,7 +6,6 @@
 :License: MIT
 """
 from test.support import EnvironmentVarGuard
-from wc_kb_gen import random
 from wc_model_gen import prokaryote
 import obj_tables
 import unittest
@@ -13,7 +13,6 @@ from wc_onto import onto as wc_ontology
 import math
 import unittest
 import wc_kb
-import wc_kb_gen
 import wc_lang
 
 
@@ -76,7 +75,7 @@ class ProteinDegradationSubmodelGeneratorTestCase(unittest.TestCase):
         kb = self.kb
         submodel = model.submodels.get_one(id='protein_degradation')
 
-        modifier_species = model.observables.get_one(id='degrade_protease_obs').expression.species
+        modifier_species = set(model.observables.get_one(id='degrade_protease_obs').expression.species)
 
         for rxn in submodel.reactions:
             self.assertEqual(len(rxn.rate_laws), 1)
@@ -7,13 +7,12 @@
 :License: MIT
 """
 
-from test.support import EnvironmentVarGuard
+from ._fixture_cache import load_kb, gen_model
 from wc_model_gen import prokaryote
 from wc_onto import onto as wc_ontology
 import math
 import unittest
 import wc_kb
-import wc_kb_gen
 import wc_lang
 
 
@@ -21,19 +20,10 @@ class RnaDegradationSubmodelGeneratorTestCase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        env = EnvironmentVarGuard()
-        env.set('CONFIG__DOT__wc_kb__DOT__io__DOT__strict', '0')
-        with env:
-            cls.kb = wc_kb.io.Reader().run('tests/fixtures/min_model_kb.xlsx',
-                                           'tests/fixtures/min_model_seq.fna',
-                                            )[wc_kb.KnowledgeBase][0]
-
-        cls.model = prokaryote.ProkaryoteModelGenerator(
-                        knowledge_base = cls.kb,
-                        component_generators=[prokaryote.InitalizeModel,
-                                              prokaryote.RnaDegradationSubmodelGenerator],
-                        options = {'component': {
-                             'RnaDegradationSubmodelGenerator': {'beta': 1.}}}).run()
+        cls.kb = load_kb()
+        cls.rnas = cls.kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)
+        cls.model = gen_model(cls.kb, [prokaryote.RnaDegradationSubmodelGenerator],
+                              options={'component': {'RnaDegradationSubmodelGenerator': {'beta': 1.}}})
 
     @classmethod
     def tearDownClass(cls):
@@ -48,45 +38,42 @@ class RnaDegradationSubmodelGeneratorTestCase(unittest.TestCase):
 
         # check reactions generated
         self.assertEqual(len(submodel.reactions),
-                         len(cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)))
+                         len(self.rnas))
 
         # check species types and species generated
-        for species in kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType):
+        for species in self.rnas:
             model_species = model.species_types.get_one(id=species.id)
             model_species_cytosol = model_species.species.get_one(compartment=cytosol)
             self.assertIsInstance(model_species, wc_lang.SpeciesType)
             self.assertIsInstance(model_species_cytosol, wc_lang.Species)
 
 
-        amp = model.species_types.get_one(id='amp').species.get_one(compartment=cytosol)
-        cmp = model.species_types.get_one(id='cmp').species.get_one(compartment=cytosol)
-        gmp = model.species_types.get_one(id='gmp').species.get_one(compartment=cytosol)
-        ump = model.species_types.get_one(id='ump').species.get_one(compartment=cytosol)
-        h2o = model.species_types.get_one(id='h2o').species.get_one(compartment=cytosol)
-        h = model.species_types.get_one(id='h').species.get_one(compartment=cytosol)
+        metabolites = {id: model.species_types.get_one(id=id).species.get_one(compartment=cytosol)
+                       for id in ('amp', 'cmp', 'gmp', 'ump', 'h2o', 'h')}
 
         # Check coeffs of reaction participants
-        rnas = kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)
-        for rxn, rna in zip(submodel.reactions, rnas):
+        for rxn, rna in zip(submodel.reactions, self.rnas):
+            coefficients = {part.species: part.coefficient for part in rxn.participants}
+            length = rna.get_len()
             self.assertEqual(
-                + rxn.participants.get_one(species=amp).coefficient
-                + rxn.participants.get_one(species=cmp).coefficient
-                + rxn.participants.get_one(species=gmp).coefficient
-                + rxn.participants.get_one(species=ump).coefficient,
-                rna.get_len())
+                + coefficients[metabolites['amp']]
+                + coefficients[metabolites['cmp']]
+                + coefficients[metabolites['gmp']]
+                + coefficients[metabolites['ump']],
+                length)
             self.assertEqual(
-                + rxn.participants.get_one(species=h2o).coefficient,
-                -(rna.get_len() - 1))
+                + coefficients[metabolites['h2o']],
+                -(length - 1))
             self.assertEqual(
-                + rxn.participants.get_one(species=h).coefficient,
-                rna.get_len() - 1)
+                + coefficients[metabolites['h']],
+                length - 1)
 
     def test_rate_laws(self):
         model = self.model
         kb = self.kb
         submodel = model.submodels.get_one(id='rna_degradation')
 
-        modifier_species = model.observables.get_one(id='degrade_rnase_obs').expression.species
+        modifier_species = set(model.observables.get_one(id='degrade_rnase_obs').expression.species)
 
         for rxn in submodel.reactions:
             self.assertEqual(len(rxn.rate_laws), 1)
@@ -8,33 +8,23 @@
 :License: MIT
 """
 
-from test.support import EnvironmentVarGuard
+from ._fixture_cache import load_kb, gen_model
 from wc_model_gen import prokaryote
 from wc_onto import onto as wc_ontology
 import math
 import unittest
 import wc_lang
 import wc_kb
-import wc_kb_gen
 
 
 class TranscriptionSubmodelGeneratorTestCase(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        env = EnvironmentVarGuard()
-        env.set('CONFIG__DOT__wc_kb__DOT__io__DOT__strict', '0')
-        with env:
-            cls.kb = wc_kb.io.Reader().run('tests/fixtures/min_model_kb.xlsx',
-                                           'tests/fixtures/min_model_seq.fna',
-                                           )[wc_kb.KnowledgeBase][0]
-
-        cls.model = prokaryote.ProkaryoteModelGenerator(
-            knowledge_base=cls.kb,
-            component_generators=[prokaryote.InitalizeModel,
-                                  prokaryote.TranscriptionSubmodelGenerator],
-            options={'component': {
-                'TranscriptionSubmodelGenerator': {'beta': 1.}}}).run()
+        cls.kb = load_kb()
+        cls.rnas = cls.kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)
+        cls.model = gen_model(cls.kb, [prokaryote.TranscriptionSubmodelGenerator],
+                              options={'component': {'TranscriptionSubmodelGenerator': {'beta': 1.}}})
 
     @classmethod
     def tearDownClass(cls):
@@ -55,7 +45,7 @@ class TranscriptionSubmodelGeneratorTestCase(unittest.TestCase):
         cytosol = model.compartments.get_one(id='c')
         submodel = model.submodels.get_one(id='transcription')
 
-        for species in kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType):
+        for species in self.rnas:
             model_species = model.species_types.get_one(id=species.id)
             model_species_cytosol = model_species.species.get_one(compartment=cytosol)
             self.assertIsInstance(model_species, wc_lang.SpeciesType)
@@ -67,17 +57,12 @@ class TranscriptionSubmodelGeneratorTestCase(unittest.TestCase):
         cytosol = model.compartments.get_one(id='c')
         submodel = model.submodels.get_one(id='transcription')
 
-        atp = model.species_types.get_one(id='atp').species.get_one(compartment=cytosol)
-        ctp = model.species_types.get_one(id='ctp').species.get_one(compartment=cytosol)
-        gtp = model.species_types.get_one(id='gtp').species.get_one(compartment=cytosol)
-        utp = model.species_types.get_one(id='utp').species.get_one(compartment=cytosol)
-        ppi = model.species_types.get_one(id='ppi').species.get_one(compartment=cytosol)
-        h2o = model.species_types.get_one(id='h2o').species.get_one(compartment=cytosol)
-        h = model.species_types.get_one(id='h').species.get_one(compartment=cytosol)
+        metabolites = {id: model.species_types.get_one(id=id).species.get_one(compartment=cytosol)
+                       for id in ('atp', 'ctp', 'gtp', 'utp', 'ppi', 'h2o', 'h')}
 
         # Check that number of RNAs = number of transcription reactions
         self.assertEqual(
-            len(kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)),
+            len(self.rnas),
             len(submodel.reactions))
 
         # Check that each reaction has the right number of participants
@@ -85,25 +70,25 @@ class TranscriptionSubmodelGeneratorTestCase(unittest.TestCase):
             self.assertEqual(len(rxn.participants), 8)
 
         # Check coeffs of reaction participants
-        rnas = kb.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)
-        for rxn, rna in zip(submodel.reactions, rnas):
-
+        for rxn, rna in zip(submodel.reactions, self.rnas):
+            coefficients = {part.species: part.coefficient for part in rxn.participants}
+            length = rna.get_len()
             self.assertEqual(
-                + rxn.participants.get_one(species=atp).coefficient
-                + rxn.participants.get_one(species=ctp).coefficient
-                + rxn.participants.get_one(species=gtp).coefficient
-                + rxn.participants.get_one(species=utp).coefficient,
-                -rna.get_len())
+                + coefficients[metabolites['atp']]
+                + coefficients[metabolites['ctp']]
+                + coefficients[metabolites['gtp']]
+                + coefficients[metabolites['utp']],
+                -length)
             self.assertEqual(
-                + rxn.participants.get_one(species=ppi).coefficient,
-                rna.get_len() -1)
+                + coefficients[metabolites['ppi']],
+                length - 1)
 
     def test_rate_laws(self):
         model = self.model
         kb = self.kb
         submodel = model.submodels.get_one(id='transcription')
 
-        modifier_species = model.observables.get_one(id='rna_polymerase_obs').expression.species
+        modifier_species = set(model.observables.get_one(id='rna_polymerase_obs').expression.species)
 
         for rxn in submodel.reactions:
             rl = rxn.rate_laws[0]
@@ -8,6 +8,7 @@
 """
 
 import wc_model_gen
+import wc_model_gen.global_vars as gvar
 import unittest
 import wc_kb
 import wc_lang
@@ -21,8 +22,8 @@ class TestModelGenerator(unittest.TestCase):
         generator = wc_model_gen.ModelGenerator(self.knowledge_base)
 
         self.assertEqual(generator.knowledge_base, self.knowledge_base)
-        self.assertEqual(generator.component_generators, [])
-        self.assertEqual(generator.options, {'id': None, 'name': None, 'version': None})
+        self.assertEqual(generator.component_generators, ())
+        self.assertEqual(generator.options, {'id': None, 'name': None, 'version': None, 'memoize': False})
 
     def test_ModelGenerator_run(self):
         generator = wc_model_gen.ModelGenerator(self.knowledge_base, options={
@@ -42,6 +43,87 @@ class TestModelGenerator(unittest.TestCase):
         self.assertEqual(model.id, 'test_model')
         self.assertEqual(model.version, '0.0.1')
 
+    def test_ModelGenerator_set_component_generators(self):
+        class ParameterGenerator(wc_model_gen.ModelComponentGenerator):
+            def run(self):
+                self.model.parameters.create(id='p', value=self.options.get('value', 1.))
+
+        generator = wc_model_gen.ModelGenerator(self.knowledge_base, options={
+            'component': {'ParameterGenerator': {'value': 2.}}})
+        self.assertEqual(generator.run().parameters, [])
+
+        generator.component_generators = [ParameterGenerator]
+        self.assertEqual(generator.component_generators, (ParameterGenerator,))
+        self.assertEqual(generator.run().parameters.get_one(id='p').value, 2.)
+
+    def test_ModelGenerator_run_memoize(self):
+        class ParameterGenerator(wc_model_gen.ModelComponentGenerator):
+            n_runs = 0
+
+            def run(self):
+                ParameterGenerator.n_runs += 1
+                self.model.parameters.create(id='p', value=self.options.get('value', 1.))
+
+        def run(options):
+            return wc_model_gen.ModelGenerator(self.knowledge_base, component_generators=[ParameterGenerator],
+                                               options=options).run()
+
+        model = run({'id': 'test_model', 'memoize': True})
+        self.assertEqual(ParameterGenerator.n_runs, 1)
+
+        model_2 = run({'id': 'test_model', 'memoize': True})
+        self.assertEqual(ParameterGenerator.n_runs, 1)
+        self.assertIsNot(model_2, model)
+        self.assertTrue(model_2.is_equal(model))
+
+        model_2.parameters.get_one(id='p').value = 2.
+        model_3 = run({'id': 'test_model', 'memoize': True})
+        self.assertEqual(ParameterGenerator.n_runs, 1)
+        self.assertEqual(model_3.parameters.get_one(id='p').value, 1.)
+
+        model = run({'id': 'test_model', 'memoize': True, 'component': {'ParameterGenerator': {'value': 3.}}})
+        self.assertEqual(ParameterGenerator.n_runs, 2)
+        self.assertEqual(model.parameters.get_one(id='p').value, 3.)
+
+        self.knowledge_base.version = '0.0.2'
+        run({'id': 'test_model', 'memoize': True})
+        self.assertEqual(ParameterGenerator.n_runs, 3)
+
+        run({'id': 'test_model'})
+        self.assertEqual(ParameterGenerator.n_runs, 4)
+
+    def test_ModelGenerator_run_memoize_restores_options_and_global_vars(self):
+        class UsageGenerator(wc_model_gen.ModelComponentGenerator):
+            n_runs = 0
+
+            def run(self):
+                UsageGenerator.n_runs += 1
+                self.options['value'] = self.options.get('value', 1.)
+                gvar.transcript_ntp_usage['trans1'] = {'A': 1, 'U': 0, 'G': 0, 'C': 0, 'len': 1}
+
+        def run(options):
+            generator = wc_model_gen.ModelGenerator(self.knowledge_base, component_generators=[UsageGenerator],
+                                                    options=options)
+            generator.run()
+            return generator
+
+        try:
+            generator = run({'id': 'test_model', 'memoize': True, 'component': {'UsageGenerator': {}}})
+            self.assertEqual(UsageGenerator.n_runs, 1)
+            self.assertEqual(generator.options['component'], {'UsageGenerator': {'value': 1.}})
+
+            gvar.transcript_ntp_usage = {}
+            generator = run({'id': 'test_model', 'memoize': True, 'component': {'UsageGenerator': {}}})
+            self.assertEqual(UsageGenerator.n_runs, 1)
+            self.assertEqual(generator.options['component'], {'UsageGenerator': {'value': 1.}})
+            self.assertEqual(gvar.transcript_ntp_usage, {'trans1': {'A': 1, 'U': 0, 'G': 0, 'C': 0, 'len': 1}})
+
+            gvar.transcript_ntp_usage['trans1']['len'] = 2
+            run({'id': 'test_model', 'memoize': True, 'component': {'UsageGenerator': {}}})
+            self.assertEqual(gvar.transcript_ntp_usage['trans1']['len'], 1)
+        finally:
+            gvar.transcript_ntp_usage = {}
+
     def test_SubmodelGenerator(self):
         model = wc_model_gen.ModelGenerator(self.knowledge_base).run()
 
@@ -54,3 +136,23 @@ class TestModelGenerator(unittest.TestCase):
 
         self.assertEqual(component_z.knowledge_base, self.knowledge_base)
         self.assertEqual(component_z.model, model)
+
+    def test_SubmodelGenerator_get_species_coefficient(self):
+        model = wc_model_gen.ModelGenerator(self.knowledge_base).run()
+        species = model.species.create(id='a[c]')
+        coefficient = species.species_coefficients.create(coefficient=-1)
+
+        class component_z_generator(wc_model_gen.SubmodelGenerator):
+            pass
+
+        component_z = component_z_generator(self.knowledge_base, model)
+
+        self.assertIs(component_z.get_species_coefficient(species, -1), coefficient)
+        coefficient_2 = component_z.get_species_coefficient(species, 2)
+        self.assertEqual(coefficient_2.coefficient, 2)
+        self.assertIs(component_z.get_species_coefficient(species, 2), coefficient_2)
+        self.assertEqual(len(species.species_coefficients), 2)
+
+        coefficient_3 = species.species_coefficients.create(coefficient=3)
+        self.assertIs(component_z.get_species_coefficient(species, 3), coefficient_3)
+        self.assertEqual(len(species.species_coefficients), 3)
@@ -17,6 +17,12 @@ import wc_lang
 
 class TestCase(unittest.TestCase):
 
+    def test_parse_units(self):
+
+        units = utils.parse_units('s^-1 * molecule^-2')
+        self.assertEqual(units, unit_registry.parse_units('s^-1 molecule^-2'))
+        self.assertIs(utils.parse_units('s^-1 * molecule^-2'), units)
+
     def test_calc_avg_syn_rate(self):
 
         test_rate = utils.calc_avg_syn_rate(0.5, 300., 36000.)
@@ -259,6 +265,18 @@ class TestCase(unittest.TestCase):
             '(s2[c] / (s2[c] + K_m_r1_s2 * Avogadro * volume_c)) * '
             '(s4[c] / (s4[c] + K_m_r1_s4 * Avogadro * volume_c))')
 
+        self.assertEqual(len(model.parameters.get(id='Avogadro')), 1)
+
+        parameters_by_id = {i.id: i for i in model.parameters}
+        reaction = wc_lang.Reaction(id='r2', participants=[participant1, participant2, participant4, participant8])
+        rate_law, parameters = utils.gen_michaelis_menten_like_rate_law(
+            model, reaction, modifiers=[modifier1], parameters_by_id=parameters_by_id)
+        self.assertEqual(rate_law.expression, 'k_cat_r2 * e1 * '
+            '(s1[c] / (s1[c] + K_m_r2_s1 * Avogadro * volume_c)) * '
+            '(s2[c] / (s2[c] + K_m_r2_s2 * Avogadro * volume_c))')
+        self.assertEqual(set(parameters), set(parameters_by_id[i] for i in ['Avogadro', 'k_cat_r2', 'K_m_r2_s1', 'K_m_r2_s2']))
+        self.assertEqual(parameters_by_id['k_cat_r2'].units, unit_registry.parse_units('s^-1 molecule^-1'))
+
         with self.assertRaises(TypeError) as ctx:
             rate_law, parameters = utils.gen_michaelis_menten_like_rate_law(
                 model, reaction, modifiers=['s6[c]'])
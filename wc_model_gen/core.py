@@ -9,14 +9,11 @@
 """
 
 import abc
+import collections
+import copy
 import os
-import time
-import wc_kb
-import wc_lang
+import wc_model_gen.global_vars as gvar
 import wc_utils.util.string
-from wc_lang.util import get_model_summary
-from wc_sim.simulation import Simulation
-from wc_sim.run_results import RunResults
 from wc_onto import onto as wc_ontology
 
 
@@ -25,13 +22,29 @@ class ModelGenerator(object):
 
     Attributes:
         knowledge_base (:obj:`wc_kb.core.KnowledgeBase`): knowledge base
-        component_generators (:obj:`list` of :obj:`ModelComponentGenerator`): model component generators
+        component_generators (:obj:`tuple` of :obj:`ModelComponentGenerator`): model component generators
         options (:obj:`dict`, optional): dictionary of options whose keys are the names of component
             generator classes and whose values are dictionaries of options for the component generator
             classes
+
+    Options:
+    * id
+    * name
+    * version
+    * memoize (:obj:`bool`, optional): if :obj:`True`, return a copy of the model generated by a previous
+        run with the same knowledge base object, knowledge base version, component generators and options
+        instead of generating it again; the options and the global variables in
+        :obj:`wc_model_gen.global_vars` are restored to their values at the end of that run; the knowledge
+        base must not be modified between such runs without changing its version; the default value
+        is :obj:`False`
+    * component
     """
 
     DEFAULT_COMPONENT_GENERATORS = ()
+    MAX_MEMOIZED_RUNS = 8
+    MEMOIZED_GLOBAL_VARS = ('transcript_ntp_usage', 'protein_aa_usage')
+
+    _memoized_runs = collections.OrderedDict()
 
     def __init__(self, knowledge_base, component_generators=None, options=None):
         """
@@ -45,13 +58,34 @@ class ModelGenerator(object):
 
         self.knowledge_base = knowledge_base
 
-        if not component_generators:
-            component_generators = list(self.DEFAULT_COMPONENT_GENERATORS)
-        self.component_generators = component_generators
+        self.component_generators = component_generators or self.DEFAULT_COMPONENT_GENERATORS
 
         self.options = options or {}
         self.clean_and_validate_options()
 
+    @property
+    def component_generators(self):
+        """ Get the model component generators
+
+        Returns:
+            :obj:`tuple` of :obj:`ModelComponentGenerator`: model component generators
+        """
+        return self._component_generators
+
+    @component_generators.setter
+    def component_generators(self, value):
+        """ Set the model component generators and the names used to look up their options
+
+        The generators are stored as a tuple so that they cannot be changed in place
+        without also updating the names used by :obj:`run`.
+
+        Args:
+            value (:obj:`list` of :obj:`ModelComponentGenerator`): model component generators
+        """
+        self._component_generators = tuple(value)
+        self._component_generator_names = tuple((component_generator.__name__, component_generator)
+                                                for component_generator in self._component_generators)
+
     def clean_and_validate_options(self):
         """ Apply default options and validate options """
         options = self.options
@@ -68,28 +102,82 @@ class ModelGenerator(object):
         assert(isinstance(version, str) or version is None)
         options['version'] = version
 
+        memoize = options.get('memoize', False)
+        assert(isinstance(memoize, bool))
+        options['memoize'] = memoize
+
     def run(self):
         """ Generate a :obj:`wc_lang` model from a :obj:`wc_kb` knowledge base
 
         Returns:
             :obj:`wc_lang.Model`: model
         """
+        # imported here rather than at module level to avoid loading wc_lang when the package is only introspected
+        import wc_lang
+
+        memoize = self.options.get('memoize', False)
+        if memoize:
+            key = self.get_memoization_key()
+            if key in self._memoized_runs:
+                self._memoized_runs.move_to_end(key)
+                _, memoized_model, memoized_options, memoized_global_vars = self._memoized_runs[key]
+                self.options.update(copy.deepcopy(memoized_options))
+                for name, value in memoized_global_vars.items():
+                    setattr(gvar, name, copy.deepcopy(value))
+                return memoized_model.copy()
+
         model = wc_lang.Model()
         model.id = self.options.get('id')
         model.name = self.options.get('name')
         model.version = self.options.get('version')
 
+        # resolve the options of the component generators before running them
+        knowledge_base = self.knowledge_base
         component_options = self.options.get('component', {})
-        for component_generator in self.component_generators:
-            options = component_options.get(component_generator.__name__, {})
-            component_generator(self.knowledge_base, model, options=options).run()
+        component_generators_options = [
+            (component_generator, component_options.get(name, {}))
+            for name, component_generator in self._component_generator_names]
+        for component_generator, options in component_generators_options:
+            component_generator(knowledge_base, model, options=options).run()
+
+        if memoize:
+            # component generators fill their default options into `self.options`, so also
+            # memoize the model under the key of the options after they have been applied
+            memoized_model = model.copy()
+            memoized_options = copy.deepcopy(self.options)
+            memoized_global_vars = {name: copy.deepcopy(getattr(gvar, name)) for name in self.MEMOIZED_GLOBAL_VARS}
+            for key in set([key, self.get_memoization_key()]):
+                if key is not None:
+                    self._memoized_runs[key] = (self.knowledge_base, memoized_model,
+                                                memoized_options, memoized_global_vars)
+                    self._memoized_runs.move_to_end(key)
+            while len(self._memoized_runs) > self.MAX_MEMOIZED_RUNS:
+                self._memoized_runs.popitem(last=False)
 
         return model
 
+    def get_memoization_key(self):
+        """ Get the key under which the model generated by :obj:`run` is memoized
+
+        The memoized entry holds a reference to the knowledge base, which prevents its
+        :obj:`id` from being reused by another knowledge base while the entry exists.
+
+        Returns:
+            :obj:`tuple`: key, or :obj:`None` if the options contain values which cannot be hashed
+        """
+        key = (self.__class__, id(self.knowledge_base), getattr(self.knowledge_base, 'version', None),
+               self.component_generators, freeze(self.options))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     """ Not sure what is the best place for the following static methods """
     @staticmethod
     def gen_rand_min_model_kb(name=None):
         """ Generates a random min model KB """
+        import wc_kb
 
         kb = wc_kb_gen.random.RandomKbGenerator(options={
             'component': {
@@ -139,6 +227,7 @@ class ModelGenerator(object):
     @staticmethod
     def run_model(model, results_dir, checkpoint_period=5, end_time=100):
         """ Simulates model """
+        from wc_sim.simulation import Simulation
 
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
@@ -151,6 +240,7 @@ class ModelGenerator(object):
     @staticmethod
     def analyze_model(self, results):
         """ Prints the standard analysis of simulation results """
+        from wc_sim.run_results import RunResults
 
         num_events = results[0]
         run_results_dir = results[1]
@@ -172,6 +262,24 @@ class ModelGenerator(object):
         print(df[['atp[c]', 'ctp[c]', 'gtp[c]', 'utp[c]']], '\n')
 
 
+def freeze(value):
+    """ Recursively convert dictionaries, lists and sets into hashable equivalents
+
+    Args:
+        value (:obj:`object`): value
+
+    Returns:
+        :obj:`object`: hashable equivalent of the value, if one exists
+    """
+    if isinstance(value, dict):
+        return frozenset((key, freeze(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(val) for val in value)
+    return value
+
+
 class ModelComponentGenerator(object, metaclass=abc.ABCMeta):
     """ Abstract base class for model component generators
 
@@ -227,6 +335,8 @@ class SubmodelGenerator(ModelComponentGenerator):
         self.options = options or {}
         self.clean_and_validate_options()
 
+        self._species_coefficients = {}
+
         # Calculate numbers needed for model construction
 
     def run(self):
@@ -251,3 +361,32 @@ class SubmodelGenerator(ModelComponentGenerator):
     def calibrate_submodel(self):
         """ Calibrate the submodel using data in the KB """
         pass # pragma: no cover
+
+    def get_species_coefficient(self, species, coefficient):
+        """ Get or create a species coefficient without scanning all of the coefficients of the species
+
+        The coefficients of each species are indexed the first time that the species is requested. The index
+        is rebuilt when a requested coefficient is missing from it and the species has gained coefficients
+        that were created by other means, e.g. by another generator, since the index was built.
+
+        Args:
+            species (:obj:`wc_lang.Species`): species
+            coefficient (:obj:`float`): coefficient
+
+        Returns:
+            :obj:`wc_lang.SpeciesCoefficient`: species coefficient
+        """
+        species_coefficients = self._species_coefficients.get(species)
+        if species_coefficients is None:
+            species_coefficients = self._species_coefficients[species] = {
+                i.coefficient: i for i in species.species_coefficients}
+
+        species_coefficient = species_coefficients.get(coefficient)
+        if species_coefficient is None and len(species_coefficients) != len(species.species_coefficients):
+            species_coefficients = self._species_coefficients[species] = {
+                i.coefficient: i for i in species.species_coefficients}
+            species_coefficient = species_coefficients.get(coefficient)
+        if species_coefficient is None:
+            species_coefficient = species_coefficients[coefficient] = species.species_coefficients.create(
+                coefficient=coefficient)
+        return species_coefficient
@@ -314,11 +314,12 @@ class ComplexationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         """ Generate rate laws for the reactions in the submodel """
         model = self.model
         rate_law_no = 0
+        parameters_by_id = {i.id: i for i in model.parameters}
         for reaction in self.submodel.reactions:
 
             if 'association' in reaction.id:
                 rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
-                    model, reaction)
+                    model, reaction, parameters_by_id=parameters_by_id)
                 rate_law_exp.expression += ' * 2 ** {}'.format(len(reaction.get_reactants()))               
 
             else:
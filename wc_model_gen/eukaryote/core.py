@@ -23,6 +23,7 @@ class EukaryoteModelGenerator(wc_model_gen.ModelGenerator):
     * id
     * name
     * version
+    * memoize
     * component
 
         * InitializeModel
@@ -56,3 +57,5 @@ class EukaryoteModelGenerator(wc_model_gen.ModelGenerator):
         version = options.get('version', wc_model_gen.__version__)
         assert(isinstance(version, str) or version is None)
         options['version'] = version
+
+        super().clean_and_validate_options()
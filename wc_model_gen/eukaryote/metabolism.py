@@ -479,6 +479,8 @@ class MetabolismSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         cytosol = model.compartments.get_one(id='c')
         beta = self.options['beta']        
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         # Rate laws for carbohydrate and lipid formation
         for reaction in model.submodels.get_one(id='macromolecular_formation').reactions:
             for reactant in reaction.get_reactants():
@@ -491,7 +493,7 @@ class MetabolismSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                     conc_model.id = conc_model.gen_id()
             substrates = [[i.species_type.id] for i in reaction.get_reactants()]
             expressions, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                model, beta, reaction.id, 'macromolecular', cytosol, substrates)
+                model, beta, reaction.id, 'macromolecular', cytosol, substrates, parameters_by_id=parameters_by_id)
 
             k_cat = model.parameters.create(
                 id='k_cat_{}'.format(reaction.id),
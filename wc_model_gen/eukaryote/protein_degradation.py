@@ -7,6 +7,8 @@
 
 from wc_onto import onto as wc_ontology
 from wc_utils.util.units import unit_registry
+import itertools
+import logging
 import math
 import numpy
 import scipy.constants
@@ -16,6 +18,8 @@ import wc_model_gen
 import wc_model_gen.global_vars as gvar
 import wc_model_gen.utils as utils
 
+logger = logging.getLogger(__name__)
+
 
 class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
     """ Generator for protein degradation submodel
@@ -77,10 +81,12 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
         self.submodel.framework = wc_ontology['WC:next_reaction_method']
                 
-        print('Start generating protein degradation submodel...')
+        logger.debug('Start generating protein degradation submodel...')
         protein_kbs = cell.species_types.get(__type=wc_kb.eukaryote.ProteinSpeciesType)
         rxn_no = 0
         self._rxn_species_modifier = {}
+        lysosome = model.compartments.get_one(id='l')
+        degradation_species = {}
         for protein_kb in protein_kbs:
 
             aa_content = {}
@@ -130,27 +136,35 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                     protein_sp.species_coefficients.get_or_create(coefficient=-1))
 
                 if protein_sp.compartment.id not in compartment_proteasomes:
-                    degradation_comp = model.compartments.get_one(id='l')
+                    degradation_comp = lysosome
                 else:
                     degradation_comp = protein_sp.compartment
+
+                # Look up the amino acid and water species of each degradation compartment only once
+                if degradation_comp.id not in degradation_species:
+                    degradation_species[degradation_comp.id] = {}
+                comp_species = degradation_species[degradation_comp.id]
+                for species_type_id in itertools.chain(aa_content, ['h2o']):
+                    if species_type_id not in comp_species:
+                        model_species = model.species_types.get_one(id=species_type_id).species.get_or_create(
+                            model=model, compartment=degradation_comp)
+                        model_species.id = model_species.gen_id()
+                        comp_species[species_type_id] = model_species
+
                 for aa_id, aa_count in aa_content.items():
-                    model_aa = model.species_types.get_one(id=aa_id).species.get_or_create(
-                        model=model, compartment=degradation_comp)
-                    model_aa.id = model_aa.gen_id()
+                    model_aa = comp_species[aa_id]
                     model_rxn.participants.add(
                         model_aa.species_coefficients.get_or_create(
                         coefficient=aa_count))        
 
-                h2o = model.species_types.get_one(id='h2o').species.get_or_create(
-                    model=model, compartment=degradation_comp)
-                h2o.id = h2o.gen_id()
+                h2o = comp_species['h2o']
                 model_rxn.participants.add(
                     h2o.species_coefficients.get_or_create(
                     coefficient=-(sum(aa_content.values())-1)))
 
                 rxn_no += 1
         
-        print('{} protein degradation reactions have been generated'.format(rxn_no))
+        logger.debug('%s protein degradation reactions have been generated', rxn_no)
             
     def gen_rate_laws(self):
         """ Generate rate laws for the reactions in the submodel """
@@ -158,6 +172,7 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         compartment_proteasomes = self.options['compartment_proteasomes']
         
         rate_law_no = 0        
+        parameters_by_id = {i.id: i for i in model.parameters}
         for reaction in self.submodel.reactions:
             
             protein_compartment_id = self._rxn_species_modifier[reaction.id][0].compartment.id
@@ -218,7 +233,7 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
             rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
                 self.model, reaction, modifiers=[modifier], modifier_reactants=modifier_reactants,
-                exclude_substrates=[h2o_species])
+                exclude_substrates=[h2o_species], parameters_by_id=parameters_by_id)
             
             rate_law = self.model.rate_laws.create(
                 direction=wc_lang.RateLawDirection.forward,
@@ -229,7 +244,7 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             rate_law.id = rate_law.gen_id()
             rate_law_no += 1
 
-        print('{} rate laws for protein degradation have been generated'.format(rate_law_no))     
+        logger.debug('%s rate laws for protein degradation have been generated', rate_law_no)
 
     def calibrate_submodel(self):
         """ Calibrate the submodel using data in the KB """
@@ -315,4 +330,4 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             model_kcat.value = median_kcat
             model_kcat.comments = 'Set to the median value because it could not be determined from data'       
 
-        print('Protein degradation submodel has been generated')
+        logger.debug('Protein degradation submodel has been generated')
@@ -149,6 +149,7 @@ class RnaDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         cytoplasm = model.compartments.get_one(id='c')
 
         rate_law_no = 0
+        parameters_by_id = {i.id: i for i in model.parameters}
         rnas_kb = cell.species_types.get(__type=wc_kb.eukaryote.TranscriptSpeciesType)
         for rna_kb in rnas_kb:
 
@@ -173,7 +174,8 @@ class RnaDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 exclude_substrates = [h2o_species]    
 
             rate_law_exp, _ = utils.gen_michaelis_menten_like_rate_law(
-                self.model, reaction, modifiers=[modifier], exclude_substrates=exclude_substrates)
+                self.model, reaction, modifiers=[modifier], exclude_substrates=exclude_substrates,
+                parameters_by_id=parameters_by_id)
             
             rate_law = self.model.rate_laws.create(
                 direction=wc_lang.RateLawDirection.forward,
@@ -12,6 +12,7 @@ from wc_utils.util.units import unit_registry
 import wc_model_gen.global_vars as gvar
 import wc_model_gen.utils as utils
 import collections
+import logging
 import math
 import numpy
 import scipy.constants
@@ -19,6 +20,8 @@ import wc_kb
 import wc_lang
 import wc_model_gen
 
+logger = logging.getLogger(__name__)
+
 
 class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
     """ Generator for transcription submodel 
@@ -92,6 +95,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             raise ValueError('The dictionary rna_pol_pair has not been provided')
         else:    
             rna_pol_pair = options['rna_pol_pair']
+        self._polr_is_mitochondrial = {polr: 'mito' in polr for polr in dict.fromkeys(rna_pol_pair.values())}
 
         init_factors = options.get('init_factors', {})
         options['init_factors'] = init_factors
@@ -171,13 +175,14 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         # Get species involved in reaction
         metabolic_participants = ['atp', 'ctp', 'gtp', 'utp', 'ppi', 
             'amp', 'cmp', 'gmp', 'ump', 'h2o', 'h', 'adp', 'pi']
-        metabolites = {}
+        species_types_by_id = {i.id: i for i in model.species_types}
+        metabolites = {nucleus.id: {}, mitochondrion.id: {}}
         for met in metabolic_participants:
-            met_species_type = model.species_types.get_one(id=met)
-            metabolites[met] = {
-                'n': met_species_type.species.get_or_create(compartment=nucleus, model=model),
-                'm': met_species_type.species.get_or_create(compartment=mitochondrion, model=model)
-                }
+            met_species_type = species_types_by_id[met]
+            metabolites[nucleus.id][met] = met_species_type.species.get_or_create(
+                compartment=nucleus, model=model)
+            metabolites[mitochondrion.id][met] = met_species_type.species.get_or_create(
+                compartment=mitochondrion, model=model)
 
         ref_polr_width = wc_lang.Reference(
             model=model,
@@ -218,29 +223,35 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             )
         ref_ribo_width.id = 'ref_'+str(len(model.references))  
 
-        print('Start generating transcription submodel...')                  
+        logger.debug('Start generating transcription submodel...')
         
         # Create for each RNA polymerase a reaction of binding to non-specific site        
-        nuclear_genome_length = 0
-        mitochondrial_genome_length = 0
-        for chromosome in cell.species_types.get(__type=wc_kb.core.DnaSpeciesType):
-            if 'M' in chromosome.id:
-                mitochondrial_genome_length += len(chromosome.get_seq())
-            else:
-                nuclear_genome_length += len(chromosome.get_seq())
-        self._mitochondrial_max_binding_sites = math.floor(
-            mitochondrial_genome_length/polr_occupancy_width)
-        self._nuclear_max_binding_sites = math.floor(
-            nuclear_genome_length/polr_occupancy_width)
+        chromosomes = cell.species_types.get(__type=wc_kb.core.DnaSpeciesType)
+        mitochondrial_genome_length = sum(i.get_len() for i in chromosomes if 'M' in i.id)
+        nuclear_genome_length = sum(i.get_len() for i in chromosomes if 'M' not in i.id)
+        self._mitochondrial_max_binding_sites = mitochondrial_genome_length // polr_occupancy_width
+        self._nuclear_max_binding_sites = nuclear_genome_length // polr_occupancy_width
 
         self._total_polr = {}
         self._gene_bound_polr = {}
+        self._polr_species = {}
         rna_pol_pair = self.options.get('rna_pol_pair')
-        for polr in set(rna_pol_pair.values()):
+
+        polr_non_specific_binding_site_st = model.species_types.get_or_create(
+            id='polr_non_specific_binding_site',
+            name='non-specific binding site of RNA polymerase',
+            type=onto['WC:pseudo_species'],
+            )
+        polr_non_specific_binding_site_st.structure = wc_lang.ChemicalStructure(
+                empirical_formula = EmpiricalFormula(),
+                molecular_weight = 0.,
+                charge = 0)
+
+        for polr, is_mitochondrial in self._polr_is_mitochondrial.items():
 
             self._gene_bound_polr[polr] = []
             
-            if 'mito' in polr:
+            if is_mitochondrial:
                 transcription_compartment = mitochondrion
                 genome_sites = self._mitochondrial_max_binding_sites
             else:
@@ -257,15 +268,6 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             conc_free_polr.comments = 'The free pool is estimated to be three quarters of the total concentration'
             conc_free_polr.references.append(ref_polr_distribution)
             
-            polr_non_specific_binding_site_st = model.species_types.get_or_create(
-                id='polr_non_specific_binding_site',
-                name='non-specific binding site of RNA polymerase',
-                type=onto['WC:pseudo_species'],
-                )
-            polr_non_specific_binding_site_st.structure = wc_lang.ChemicalStructure(
-                    empirical_formula = EmpiricalFormula(),
-                    molecular_weight = 0.,
-                    charge = 0)
             polr_non_specific_binding_site_species = model.species.get_or_create(
                 species_type=polr_non_specific_binding_site_st, compartment=transcription_compartment)
             polr_non_specific_binding_site_species.id = polr_non_specific_binding_site_species.gen_id()
@@ -301,32 +303,32 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 references=[ref_polr_distribution])
             conc_model.id = conc_model.gen_id()
 
+            self._polr_species[(polr, transcription_compartment.id)] = (polr_complex, polr_complex_species,
+                polr_non_specific_binding_site_species, polr_bound_non_specific_species)
+
             ns_binding_reaction = model.reactions.create(
                 submodel=self.submodel, id='non_specific_binding_{}'.format(polr_complex.id),
                 name='non-specific binding of {} in {}'.format(polr, transcription_compartment.name),
                 reversible=False)
             
-            ns_binding_reaction.participants.append(
-                polr_complex_species.species_coefficients.get_or_create(
-                coefficient=-1))
-            ns_binding_reaction.participants.append(
-                polr_non_specific_binding_site_species.species_coefficients.get_or_create(
-                coefficient=-1))
-            ns_binding_reaction.participants.append(
-                polr_bound_non_specific_species.species_coefficients.get_or_create(
-                coefficient=1))
+            ns_binding_reaction.participants.append(self.get_species_coefficient(
+                polr_complex_species, -1))
+            ns_binding_reaction.participants.append(self.get_species_coefficient(
+                polr_non_specific_binding_site_species, -1))
+            ns_binding_reaction.participants.append(self.get_species_coefficient(
+                polr_bound_non_specific_species, 1))
         
         # Create initiation and elongation reactions for each RNA
         init_el_rxn_no = 0
         transcribed_genes = [i for i in cell.loci.get(__type=wc_kb.eukaryote.GeneLocus) \
             if i.transcripts]
-        self._initiation_polr_species = {}
         self._elongation_modifier = {}
         self._allowable_queue_len = {}        
         for gene in transcribed_genes:
             
             transcription_compartment = mitochondrion if 'M' in gene.polymer.id else nucleus
             translation_compartment = mitochondrion if 'M' in gene.polymer.id else cytosol
+            compartment_metabolites = metabolites[transcription_compartment.id]
 
             len_add_rna = 0
             if len(gene.transcripts) == 1:
@@ -344,30 +346,13 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                             seq = rna_input_seq[add_transcript]
                         else:
                             seq = cell.species_types.get_one(id=add_transcript).get_seq()    
-                        add_count = gvar.transcript_ntp_usage[add_transcript] = {
-                            'A': seq.upper().count('A'),
-                            'C': seq.upper().count('C'),
-                            'G': seq.upper().count('G'),
-                            'U': seq.upper().count('U'),
-                            'len': len(seq),
-                            }
+                        add_count = gvar.transcript_ntp_usage[add_transcript] = count_ntps(seq)
                     add_seq = {k:v+add_count[k] for k,v in add_seq.items()}
             
             # Create initiation reaction
-            polr_complex = model.species_types.get_one(name=rna_pol_pair[rna_kb.id])
-            polr_complex_species = model.species.get_one(
-                species_type=polr_complex, compartment=transcription_compartment)
-            self._initiation_polr_species[rna_kb.id] = polr_complex_species
-            
-            polr_bound_non_specific_species_type = model.species_types.get_one(
-                id='{}_bound_non_specific_site'.format(polr_complex.id))
-            polr_bound_non_specific_species = model.species.get_one(
-                species_type=polr_bound_non_specific_species_type, compartment=transcription_compartment)
-            
-            polr_non_specific_binding_site_st = model.species_types.get_one(
-                id='polr_non_specific_binding_site')
-            polr_non_specific_binding_site_species = model.species.get_one(
-                species_type=polr_non_specific_binding_site_st, compartment=transcription_compartment)
+            polr_complex, polr_complex_species, polr_non_specific_binding_site_species, \
+                polr_bound_non_specific_species = self._polr_species[
+                    (rna_pol_pair[rna_kb.id], transcription_compartment.id)]
             
             polr_binding_site_st = model.species_types.get_or_create(
                 id='{}_binding_site'.format(gene.id),
@@ -386,7 +371,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             gene_len = len(gene_seq) + (add_seq['len'] if add_seq else 0)
             conc_model = model.distribution_init_concentrations.create(
                 species=polr_binding_site_species,
-                mean=math.floor(gene_len/polr_occupancy_width) + 1,
+                mean=gene_len // polr_occupancy_width + 1,
                 units=unit_registry.parse_units('molecule'),
                 comments='Set to gene length divided by {} bp to allow '
                     'queueing of RNA polymerase during transcription'.format(polr_occupancy_width),
@@ -421,56 +406,44 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 name='transcription initiation of ' + rna_kb.name,
                 reversible=False, comments='Set to irreversible to model only the net flux')
             
-            init_reaction.participants.append(
-                polr_bound_non_specific_species.species_coefficients.get_or_create(
-                coefficient=-1))
-            init_reaction.participants.append(
-                polr_binding_site_species.species_coefficients.get_or_create(
-                coefficient=-1))
-            init_reaction.participants.append(
-                polr_bound_species.species_coefficients.get_or_create(
-                coefficient=1))
-            init_reaction.participants.append(
-                polr_non_specific_binding_site_species.species_coefficients.get_or_create(
-                coefficient=1))
+            init_reaction.participants.append(self.get_species_coefficient(
+                polr_bound_non_specific_species, -1))
+            init_reaction.participants.append(self.get_species_coefficient(
+                polr_binding_site_species, -1))
+            init_reaction.participants.append(self.get_species_coefficient(
+                polr_bound_species, 1))
+            init_reaction.participants.append(self.get_species_coefficient(
+                polr_non_specific_binding_site_species, 1))
 
             # Add ATP hydrolysis requirement for DNA melting and promoter escape by RNA polymerase II
             if 'RNA Polymerase II' in rna_pol_pair[rna_kb.id]:
-                init_reaction.participants.append(metabolites['atp'][
-                    transcription_compartment.id].species_coefficients.get_or_create(
-                    coefficient=-2))
-                init_reaction.participants.append(metabolites['h2o'][
-                    transcription_compartment.id].species_coefficients.get_or_create(
-                    coefficient=-2))
-                init_reaction.participants.append(metabolites['adp'][
-                    transcription_compartment.id].species_coefficients.get_or_create(
-                    coefficient=2))
-                init_reaction.participants.append(metabolites['pi'][
-                    transcription_compartment.id].species_coefficients.get_or_create(
-                    coefficient=2))
-                init_reaction.participants.append(metabolites['h'][
-                    transcription_compartment.id].species_coefficients.get_or_create(
-                    coefficient=2))
+                init_reaction.participants.append(self.get_species_coefficient(
+                    compartment_metabolites['atp'], -2))
+                init_reaction.participants.append(self.get_species_coefficient(
+                    compartment_metabolites['h2o'], -2))
+                init_reaction.participants.append(self.get_species_coefficient(
+                    compartment_metabolites['adp'], 2))
+                init_reaction.participants.append(self.get_species_coefficient(
+                    compartment_metabolites['pi'], 2))
+                init_reaction.participants.append(self.get_species_coefficient(
+                    compartment_metabolites['h'], 2))
 
             # Create elongation reaction
-            rna_model = model.species_types.get_one(id=rna_kb.id).species[0]
+            rna_model = species_types_by_id[rna_kb.id].species[0]
             reaction = model.reactions.get_or_create(
                 submodel=self.submodel, id='transcription_elongation_' + rna_kb.id,
                 name='transcription elongation of ' + rna_kb.name,
                 reversible=False, comments='Lumped reaction')            
 
+            # Count the nucleotides of the pre-RNA from the gene sequence, which the pre-RNA
+            # has the same length as and either transcribes or reverse complements and transcribes
+            gene_count = count_ntps(gene_seq, bases='ACGTN')
             if rna_kb.gene.strand == wc_kb.core.PolymerStrand.positive:
-                pre_rna_seq = gene_seq.transcribe()
+                pre_rna_count = {'A': gene_count['A'], 'C': gene_count['C'], 'G': gene_count['G'],
+                    'U': gene_count['T'], 'N': gene_count['N'], 'len': gene_count['len']}
             else:
-                pre_rna_seq = gene_seq.reverse_complement().transcribe()
-            pre_rna_count = {
-                'A': pre_rna_seq.upper().count('A'),
-                'C': pre_rna_seq.upper().count('C'),
-                'G': pre_rna_seq.upper().count('G'),
-                'U': pre_rna_seq.upper().count('U'),
-                'N': pre_rna_seq.upper().count('N'),
-                'len': len(pre_rna_seq),
-                }
+                pre_rna_count = {'A': gene_count['T'], 'C': gene_count['G'], 'G': gene_count['C'],
+                    'U': gene_count['A'], 'N': gene_count['N'], 'len': gene_count['len']}
             
             if rna_kb.id in gvar.transcript_ntp_usage:
                 ntp_count = gvar.transcript_ntp_usage[rna_kb.id]
@@ -479,75 +452,53 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                     seq = rna_input_seq[rna_kb.id]
                 else:    
                     seq = rna_kb.get_seq()
-                ntp_count = gvar.transcript_ntp_usage[rna_kb.id] = {
-                    'A': seq.upper().count('A'),
-                    'C': seq.upper().count('C'),
-                    'G': seq.upper().count('G'),
-                    'U': seq.upper().count('U'),
-                    'len': len(seq),
-                    }
+                ntp_count = gvar.transcript_ntp_usage[rna_kb.id] = count_ntps(seq)
 
             if add_seq:
                 pre_rna_count = {k:(v+add_seq[k] if k in add_seq else v) for k,v in pre_rna_count.items()}
                 ntp_count = {k:v+add_seq[k] for k,v in ntp_count.items()}        
 
             # Adding participants to LHS
-            reaction.participants.append(
-                polr_bound_species.species_coefficients.get_or_create(
-                coefficient=-1))
-            reaction.participants.append(metabolites['atp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=-pre_rna_count['A']))
-            reaction.participants.append(metabolites['ctp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=-pre_rna_count['C']))
-            reaction.participants.append(metabolites['gtp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=-pre_rna_count['G']))
-            reaction.participants.append(metabolites['utp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=-pre_rna_count['U']))
-            reaction.participants.append(metabolites['h2o'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=-(pre_rna_count['len']-pre_rna_count['N']+len_add_rna
-                    -ntp_count['len']+1)))
+            reaction.participants.append(self.get_species_coefficient(
+                polr_bound_species, -1))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['atp'], -pre_rna_count['A']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['ctp'], -pre_rna_count['C']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['gtp'], -pre_rna_count['G']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['utp'], -pre_rna_count['U']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['h2o'],
+                -(pre_rna_count['len']-pre_rna_count['N']+len_add_rna-ntp_count['len']+1)))
             
             # Adding participants to RHS
             if rna_kb.id in transcription_unit:
                 for add_transcript in transcription_unit[rna_kb.id]:
-                    add_rna_model = model.species_types.get_one(id=add_transcript).species[0]
-                    reaction.participants.append(
-                        add_rna_model.species_coefficients.get_or_create(
-                        coefficient=1))
-
-            reaction.participants.append(
-                rna_model.species_coefficients.get_or_create(
-                coefficient=1))
-            reaction.participants.append(metabolites['ppi'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['len']-pre_rna_count['N']))
-            reaction.participants.append(metabolites['amp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['A']-ntp_count['A']))
-            reaction.participants.append(metabolites['cmp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['C']-ntp_count['C']))
-            reaction.participants.append(metabolites['gmp'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['G']-ntp_count['G']))
-            reaction.participants.append(metabolites['ump'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['U']-ntp_count['U']))
-            reaction.participants.append(metabolites['h'][
-                transcription_compartment.id].species_coefficients.get_or_create(
-                coefficient=pre_rna_count['len']-pre_rna_count['N']+len_add_rna
-                    -ntp_count['len']+1))
-            reaction.participants.append(
-                polr_complex_species.species_coefficients.get_or_create(
-                coefficient=1))
-            reaction.participants.append(
-                polr_binding_site_species.species_coefficients.get_or_create(
-                coefficient=1))
+                    add_rna_model = species_types_by_id[add_transcript].species[0]
+                    reaction.participants.append(self.get_species_coefficient(
+                        add_rna_model, 1))
+
+            reaction.participants.append(self.get_species_coefficient(
+                rna_model, 1))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['ppi'], pre_rna_count['len']-pre_rna_count['N']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['amp'], pre_rna_count['A']-ntp_count['A']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['cmp'], pre_rna_count['C']-ntp_count['C']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['gmp'], pre_rna_count['G']-ntp_count['G']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['ump'], pre_rna_count['U']-ntp_count['U']))
+            reaction.participants.append(self.get_species_coefficient(
+                compartment_metabolites['h'],
+                pre_rna_count['len']-pre_rna_count['N']+len_add_rna-ntp_count['len']+1))
+            reaction.participants.append(self.get_species_coefficient(
+                polr_complex_species, 1))
+            reaction.participants.append(self.get_species_coefficient(
+                polr_binding_site_species, 1))
 
             all_transcripts = [rna_kb]
             if rna_kb.id in transcription_unit:
@@ -569,15 +520,12 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                         species_type=ribo_binding_site_st, compartment=translation_compartment)
                     ribo_binding_site_species.id = ribo_binding_site_species.gen_id()
 
-                    site_per_rna = math.floor(gvar.transcript_ntp_usage[rna.id]['len'] / \
-                        ribosome_occupancy_width) + 1
-                    reaction.participants.append(
-                        ribo_binding_site_species.species_coefficients.get_or_create(
-                        coefficient=site_per_rna))
+                    site_per_rna = gvar.transcript_ntp_usage[rna.id]['len'] // ribosome_occupancy_width + 1
+                    reaction.participants.append(self.get_species_coefficient(
+                        ribo_binding_site_species, site_per_rna))
 
-                    rna_model = model.species_types.get_one(id=rna.id).species[0]
-                    rna_init_conc = model.distribution_init_concentrations.get_one(
-                        species=rna_model).mean
+                    rna_model = species_types_by_id[rna.id].species[0]
+                    rna_init_conc = rna_model.distribution_init_concentration.mean
                     conc_model = model.distribution_init_concentrations.create(
                         species=ribo_binding_site_species,
                         mean=site_per_rna * rna_init_conc,
@@ -590,8 +538,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
             init_el_rxn_no += 1
 
-        print('{} reactions each for initiation and elongation have been generated'.format(
-            init_el_rxn_no))    
+        logger.debug('%s reactions each for initiation and elongation have been generated', init_el_rxn_no)
 
     def gen_rate_laws(self):
         """ Generate rate laws for the reactions in the submodel """
@@ -664,18 +611,19 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             units=unit_registry.parse_units('molecule'),
             comments='Boolean switch for determining if binding site is still available'
             )                         
+
+        parameters_by_id = {i.id: i for i in model.parameters}
                 
         # Generate rate law for binding of RNA polymerase to non-specific site       
         rna_pol_pair = self.options.get('rna_pol_pair')
         self._polr_pool = {}
-        for polr in set(rna_pol_pair.values()):            
-            transcription_compartment = mitochondrion if 'mito' in polr else nucleus
+        for polr, is_mitochondrial in self._polr_is_mitochondrial.items():
+            transcription_compartment = mitochondrion if is_mitochondrial else nucleus
             ns_binding_reaction = model.reactions.get_one(
                 name='non-specific binding of {} in {}'.format(polr, transcription_compartment.name))
 
-            polr_complex = model.species_types.get_one(name=polr)
-            polr_complex_species = model.species.get_one(
-                species_type=polr_complex, compartment=transcription_compartment)
+            polr_complex, polr_complex_species, _, polr_bound_non_specific_species = self._polr_species[
+                (polr, transcription_compartment.id)]
 
             non_specific_binding_constant = model.parameters.create(
                 id='k_non_specific_binding_{}'.format(polr_complex.id),
@@ -699,29 +647,22 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             ns_binding_rate_law.id = ns_binding_rate_law.gen_id()
 
             # Create observable for total RNA polymerase
-            polr_bound_non_specific_species = model.species.get_one(
-                species_type=model.species_types.get_one(
-                    id='{}_bound_non_specific_site'.format(polr_complex.id)), 
-                compartment=transcription_compartment)
-            
             self._polr_pool[polr] = {i.id: i for i in self._gene_bound_polr[polr]}
             self._polr_pool[polr][polr_complex_species.id] = polr_complex_species        
             self._polr_pool[polr][polr_bound_non_specific_species.id] = polr_bound_non_specific_species 
             
-            chunked_data = [[k, v] for k, v in self._polr_pool[polr].items()]
+            polr_pool_ids = list(self._polr_pool[polr])
             size = 800
-            chunked_data = [chunked_data[i * size:(i + 1) * size] for i in range((len(chunked_data) + size - 1) // size )]
-            
-            all_subtotal_obs = {}
             group = 10
-            for ind, chunk in enumerate(chunked_data):
-                chunked_dict = {k:v for k,v in chunk}
-                expr = list(chunked_dict.keys())
-                expr = [expr[i * group:(i + 1) * group] for i in range((len(expr) + group - 1) // group )]
-                expr = ' + '.join(['('+' + '.join(i)+')' for i in expr])              
+
+            all_subtotal_obs = {}
+            for ind, chunk_start in enumerate(range(0, len(polr_pool_ids), size)):
+                chunk_ids = polr_pool_ids[chunk_start:chunk_start + size]
+                expr = ' + '.join(['(' + ' + '.join(chunk_ids[i:i + group]) + ')'
+                    for i in range(0, len(chunk_ids), group)])
                 polr_subtotal_exp, error = wc_lang.ObservableExpression.deserialize(
                     expr,
-                    {wc_lang.Species: chunked_dict})            
+                    {wc_lang.Species: {i: self._polr_pool[polr][i] for i in chunk_ids}})
                 assert error is None, str(error)                
                 polr_subtotal_obs = model.observables.create(
                     id='subtotal_{}_{}_{}'.format(polr_complex_species.species_type.id, transcription_compartment.id, ind+1), 
@@ -761,7 +702,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
                     model, beta, 'transcription_init_{}'.format(rnap[:4]), 'transcription_init_{}'.format(rnap[:4]), 
-                    compartment, [factor])
+                    compartment, [factor], parameters_by_id=parameters_by_id)
                 
                 objects = {
                             wc_lang.Species: all_species,
@@ -792,7 +733,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
                     model, beta, 'transcription_el_{}'.format(rnap[:4]), 'transcription_el_{}'.format(rnap[:4]), 
-                    compartment, [factor])
+                    compartment, [factor], parameters_by_id=parameters_by_id)
                 
                 objects = {
                             wc_lang.Species: all_species,
@@ -823,7 +764,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
                     model, beta, 'transcription_neg_{}'.format(rnap[:4]), 'transcription_neg_{}'.format(rnap[:4]), 
-                    compartment, [factor])
+                    compartment, [factor], parameters_by_id=parameters_by_id)
                 
                 objects = {
                             wc_lang.Species: all_species,
@@ -856,6 +797,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         transcribed_together = [j for i in transcription_unit.values() for j in i]                    
         rnas_kb = [i for i in cell.species_types.get(__type=wc_kb.eukaryote.TranscriptSpeciesType) \
             if i.id not in transcribed_together]
+        species_types_by_id = {i.id: i for i in model.species_types}
         for rna_kb in rnas_kb:
 
             rna_kb_compartment_id = rna_kb.species[0].compartment.id
@@ -894,13 +836,13 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             for reg in rna_kb.gene.regulatory_modules:                                
                 for tf in reg.transcription_factor_regulation: 
                     
-                    tf_model = model.species.get_one(
-                        species_type=model.species_types.get_one(id=tf.transcription_factor.id), 
-                        compartment=transcription_compartment)                   
+                    tf_species_type = species_types_by_id.get(tf.transcription_factor.id)
+                    tf_model = tf_species_type.species.get_one(
+                        compartment=transcription_compartment) if tf_species_type else None
                     
                     if tf_model and tf.direction == wc_kb.eukaryote.RegulatoryDirection.activation:                        
                         F_act, species_act, param_act, func_act = utils.simple_activator(
-                            model, reaction_id, tf_model)
+                            model, reaction_id, tf_model, parameters_by_id=parameters_by_id)
                         F_regs.append(F_act)
                         reg_species.update(species_act)
                         reg_parameters.update(param_act)
@@ -908,7 +850,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                         
                     elif tf_model and tf.direction == wc_kb.eukaryote.RegulatoryDirection.repression:
                         F_rep, species_rep, param_rep, func_rep = utils.simple_repressor(
-                            model, reaction_id, tf_model) 
+                            model, reaction_id, tf_model, parameters_by_id=parameters_by_id) 
                         F_regs.append(F_rep)
                         reg_species.update(species_rep)
                         reg_parameters.update(param_rep)
@@ -917,16 +859,10 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             F_reg_N = ' * '.join(F_regs)
 
             # Generate rate law for initiation
-            polr_bound_non_specific_species = model.species.get_one(
-                species_type=model.species_types.get_one(
-                    id='{}_bound_non_specific_site'.format(
-                        self._initiation_polr_species[rna_kb.id].species_type.id)), 
-                compartment=transcription_compartment)
+            _, polr_complex_species, _, polr_bound_non_specific_species = self._polr_species[
+                (rna_pol_pair[rna_kb.id], transcription_compartment.id)]
             reg_species[polr_bound_non_specific_species.id] = polr_bound_non_specific_species
 
-            polr_complex_species = model.species.get_one(
-                species_type=model.species_types.get_one(name=rna_pol_pair[rna_kb.id]), 
-                compartment=transcription_compartment)
             polr_obs = model.observables.get_one(
                 id='total_{}_{}'.format(polr_complex_species.species_type.id, transcription_compartment.id))
 
@@ -1040,7 +976,8 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             substrates = [[i.species_type.id] for i in elongation_reaction.get_reactants() 
                 if (i.species_type.id!='h2o' and i!=polr_gene_bound_species)]
             expressions, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                model, beta, elongation_reaction.id, 'transcription_elongation', transcription_compartment, substrates)
+                model, beta, elongation_reaction.id, 'transcription_elongation', transcription_compartment, substrates,
+                parameters_by_id=parameters_by_id)
             expression_terms += expressions
             objects[wc_lang.Species].update(all_species)
             objects[wc_lang.Parameter].update(all_parameters)
@@ -1074,7 +1011,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
             rate_law_no += 1
 
-        print('{} rate laws for initiation and elongation have been generated'.format(rate_law_no))              
+        logger.debug('%s rate laws for initiation and elongation have been generated', rate_law_no)
         
     def calibrate_submodel(self):
         """ Calibrate the submodel using data in the KB """
@@ -1084,6 +1021,11 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         nucleus = model.compartments.get_one(id='n')
         mitochondrion = model.compartments.get_one(id='m')
 
+        init_compartment_volumes = {
+            nucleus.id: nucleus.init_volume.mean * nucleus.init_density.value,
+            mitochondrion.id: mitochondrion.init_volume.mean * mitochondrion.init_density.value,
+            }
+
         transcription_unit = self.options['transcription_unit']
 
         beta = self.options.get('beta')
@@ -1098,7 +1040,17 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             value=scipy.constants.Avogadro,
             units=unit_registry.parse_units('molecule mol^-1'))
 
-        mean_doubling_time = model.parameters.get_one(id='mean_doubling_time').value
+        # Index the model objects that are looked up by id for each RNA
+        species_types_by_id = {i.id: i for i in model.species_types}
+        species_by_id = {i.id: i for i in model.species}
+        parameters_by_id = {i.id: i for i in model.parameters}
+        reactions_by_id = {i.id: i for i in model.reactions}
+
+        mean_doubling_time = parameters_by_id['mean_doubling_time'].value
+
+        # Share the total concentration of each RNA polymerase equally among the species in its pool
+        polr_pool_counts = {polr: dict.fromkeys(pool, self._total_polr[polr] / len(pool))
+            for polr, pool in self._polr_pool.items()}
 
         average_rate = {}
         p_bound = {}
@@ -1110,7 +1062,7 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             transcription_compartment = nucleus if rna_kb.species[0].compartment.id == 'c' else mitochondrion 
             
             # Estimate the average rate of transcription
-            rna_product = model.species_types.get_one(id=rna_kb.id).species[0]
+            rna_product = species_types_by_id[rna_kb.id].species[0]
             
             half_life = rna_kb.properties.get_one(property='half-life').get_value()
             mean_concentration = rna_product.distribution_init_concentration.mean         
@@ -1120,12 +1072,12 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
             # Estimate the average probability of RNA polymerase binding            
             init_reg_species_count = {}                
-            init_reaction = model.reactions.get_one(id='transcription_initiation_' + rna_kb.id)
+            init_reaction = reactions_by_id['transcription_initiation_' + rna_kb.id]
             for param in init_reaction.rate_laws[0].expression.functions[0].expression.parameters:
                 
                 if 'Kr_' in param.id:
-                    repressor_species = model.species.get_one(
-                        id='{}[{}]'.format(param.id.split('_')[-1], transcription_compartment.id))
+                    repressor_species = species_by_id.get(
+                        '{}[{}]'.format(param.id.split('_')[-1], transcription_compartment.id))
                     init_reg_species_count[repressor_species.id] = \
                         repressor_species.distribution_init_concentration.mean
                     if repressor_species.distribution_init_concentration.mean:    
@@ -1139,8 +1091,8 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                             repressor_species.species_type.id, repressor_species.compartment.name)
                         
                 elif 'Ka_' in param.id:
-                    activator_species = model.species.get_one(
-                        id='{}[{}]'.format(param.id.split('_')[-1], transcription_compartment.id))
+                    activator_species = species_by_id.get(
+                        '{}[{}]'.format(param.id.split('_')[-1], transcription_compartment.id))
                     init_reg_species_count[activator_species.id] = \
                         activator_species.distribution_init_concentration.mean
                     if activator_species.distribution_init_concentration.mean:    
@@ -1156,17 +1108,12 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 elif 'f_' in param.id:
                     param.value = activator_effect
 
-            total_polr = self._total_polr[rna_pol_pair[rna_kb.id]]
-            no_of_polr_pool = len(self._polr_pool[rna_pol_pair[rna_kb.id]])
-            for i in self._polr_pool[rna_pol_pair[rna_kb.id]]:
-                init_reg_species_count[i] = total_polr / no_of_polr_pool            
+            init_reg_species_count.update(polr_pool_counts[rna_pol_pair[rna_kb.id]])
             
             p_bound_function = self._gene_p_function_map[rna_kb.id]
             p_bound_value = p_bound_function.expression._parsed_expression.eval({
                 wc_lang.Species: init_reg_species_count,
-                wc_lang.Compartment: {
-                    transcription_compartment.id: transcription_compartment.init_volume.mean * \
-                        transcription_compartment.init_density.value},
+                wc_lang.Compartment: init_compartment_volumes,
                 })
             p_bound[rna_kb.id] = p_bound_value
         
@@ -1180,20 +1127,12 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         total_gene_bound = {}
         for polr, rnas in polr_rna_pair.items():
             
-            transcription_compartment = mitochondrion if 'mito' in polr else nucleus
-
-            polr_complex = model.species_types.get_one(name=polr)
-            polr_complex_species = model.species.get_one(
-                species_type=polr_complex, compartment=transcription_compartment)
-            polr_free_conc = model.distribution_init_concentrations.get_one(
-                species=polr_complex_species).mean
+            transcription_compartment = mitochondrion if self._polr_is_mitochondrial[polr] else nucleus
 
-            polr_ns_bound = model.species_types.get_one(
-                    id='{}_bound_non_specific_site'.format(polr_complex.id))
-            polr_ns_bound_species = model.species.get_one(
-                species_type=polr_ns_bound, compartment=transcription_compartment)
-            polr_ns_bound_conc = model.distribution_init_concentrations.get_one(
-                species=polr_ns_bound_species).mean
+            polr_complex, polr_complex_species, _, polr_ns_bound_species = self._polr_species[
+                (polr, transcription_compartment.id)]
+            polr_free_conc = polr_complex_species.distribution_init_concentration.mean
+            polr_ns_bound_conc = polr_ns_bound_species.distribution_init_concentration.mean
 
             total_gene_bound[polr] = self._total_polr[polr] - polr_free_conc - polr_ns_bound_conc
 
@@ -1203,36 +1142,44 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 total_polr_usage_rate += average_rate[rna_id]
                 total_p_bound[polr] += p_bound[rna_id]           
             
-            non_specific_binding_constant = model.parameters.get_one(
-                id='k_non_specific_binding_{}'.format(polr_complex.id))
-            non_specific_binding_constant.value = total_polr_usage_rate / polr_free_conc
-
-            specific_binding_constant = model.parameters.get_one(
-                id='k_specific_binding_{}'.format(polr_complex.id))
-            specific_binding_constant.value = total_polr_usage_rate / \
-                (polr_ns_bound_conc * total_p_bound[polr])
+            non_specific_binding_constant = parameters_by_id['k_non_specific_binding_{}'.format(polr_complex.id)]
+            if polr_free_conc:
+                non_specific_binding_constant.value = total_polr_usage_rate / polr_free_conc
+            else:
+                non_specific_binding_constant.value = 0.
+                non_specific_binding_constant.comments = 'The value was assigned to 0 because the concentration ' +\
+                    'of free {} in {} was zero'.format(polr, transcription_compartment.name)
+
+            specific_binding_constant = parameters_by_id['k_specific_binding_{}'.format(polr_complex.id)]
+            if polr_ns_bound_conc and total_p_bound[polr]:
+                specific_binding_constant.value = total_polr_usage_rate / \
+                    (polr_ns_bound_conc * total_p_bound[polr])
+            else:
+                specific_binding_constant.value = 0.
+                specific_binding_constant.comments = 'The value was assigned to 0 because the concentration ' +\
+                    'of non-specifically bound {} or the probability of binding its genes in {} was zero'.format(
+                    polr, transcription_compartment.name)
             
         # Calibrate the reaction constant of lumped elongation and termination                         
         undetermined_model_kcat = []
         determined_kcat = []
         for rna_kb in rnas_kb: 
 
-            transcription_compartment = nucleus if rna_kb.species[0].compartment.id == 'c' else mitochondrion
-
-            polr_gene_bound_conc = min(self._allowable_queue_len[rna_kb.id][1], 
-                p_bound[rna_kb.id] / total_p_bound[rna_pol_pair[rna_kb.id]] * \
-                total_gene_bound[rna_pol_pair[rna_kb.id]])
+            if total_p_bound[rna_pol_pair[rna_kb.id]]:
+                polr_gene_bound_conc = min(self._allowable_queue_len[rna_kb.id][1], 
+                    p_bound[rna_kb.id] / total_p_bound[rna_pol_pair[rna_kb.id]] * \
+                    total_gene_bound[rna_pol_pair[rna_kb.id]])
+            else:
+                polr_gene_bound_conc = 0.
             
             polr_gene_bound_species = self._elongation_modifier[rna_kb.id]            
-            model.distribution_init_concentrations.get_one(
-                species=polr_gene_bound_species).mean = polr_gene_bound_conc
+            polr_gene_bound_species.distribution_init_concentration.mean = polr_gene_bound_conc
             
             init_species_counts = {}
-            reaction = model.reactions.get_one(id='transcription_elongation_' + rna_kb.id)
+            reaction = reactions_by_id['transcription_elongation_' + rna_kb.id]
             for species in reaction.rate_laws[0].expression.species:
                 init_species_counts[species.id] = species.distribution_init_concentration.mean
-                model_Km = model.parameters.get_one(
-                        id='K_m_{}_{}'.format(reaction.id, species.species_type.id))
+                model_Km = parameters_by_id.get('K_m_{}_{}'.format(reaction.id, species.species_type.id))
                 if model_Km:
                     if species.distribution_init_concentration.mean:                    
                         model_Km.value = beta * species.distribution_init_concentration.mean \
@@ -1251,15 +1198,13 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                     for species in obs.expression.species:    
                         init_species_counts[species.id] = species.distribution_init_concentration.mean            
             
-            model_kcat = model.parameters.get_one(id='k_cat_{}'.format(reaction.id))
+            model_kcat = parameters_by_id['k_cat_{}'.format(reaction.id)]
 
             if average_rate[rna_kb.id]:
                 model_kcat.value = 1.
                 eval_rate_law = reaction.rate_laws[0].expression._parsed_expression.eval({
                     wc_lang.Species: init_species_counts,
-                    wc_lang.Compartment: {
-                        transcription_compartment.id: transcription_compartment.init_volume.mean * \
-                            transcription_compartment.init_density.value},
+                    wc_lang.Compartment: init_compartment_volumes,
                     })
                 if eval_rate_law:
                     model_kcat.value = average_rate[rna_kb.id] / eval_rate_law                    
@@ -1274,4 +1219,22 @@ class TranscriptionSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             model_kcat.value = median_kcat
             model_kcat.comments = 'Set to the median value because it could not be determined from data'
 
-        print('Transcription submodel has been generated')        
+        logger.debug('Transcription submodel has been generated')
+
+
+def count_ntps(seq, bases='ACGU'):
+    """ Count the nucleotides in a sequence in a single pass
+
+    Args:
+        seq (:obj:`str` or :obj:`Bio.Seq.Seq`): sequence
+        bases (:obj:`str`, optional): bases to count (case-insensitive)
+
+    Returns:
+        :obj:`dict`: dictionary with the bases and 'len' as keys, and the number of each
+            base and the length of the sequence as values
+    """
+    seq = str(seq).encode()
+    counts = numpy.bincount(numpy.frombuffer(seq, dtype=numpy.uint8), minlength=128)
+    ntp_count = {base: int(counts[ord(base.upper())] + counts[ord(base.lower())]) for base in bases}
+    ntp_count['len'] = len(seq)
+    return ntp_count
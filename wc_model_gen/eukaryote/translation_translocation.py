@@ -580,6 +580,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             comments='Boolean switch for determining if binding site is still available'
             )      
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         # Generate response function for the tRNA(s) of each codon and for each amino acid
         trna_kb = cell.species_types.get(__type=wc_kb.eukaryote.TranscriptSpeciesType,
                                         type=wc_kb.eukaryote.TranscriptType.tRna)
@@ -622,7 +624,7 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
                     model, beta, 'translation_{}'.format(compartment.id), 'translation_{}'.format(compartment.id), 
-                    compartment, [trnas['trna']])
+                    compartment, [trnas['trna']], parameters_by_id=parameters_by_id)
 
                 objects = {
                         wc_lang.Species: all_species,
@@ -660,7 +662,7 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 for compartment in [cytosol, mitochondrion]:
                     factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
                         model, beta, 'translation_{}'.format(compartment.id), 'translation_{}'.format(compartment.id), 
-                        compartment, [[aa_id]])
+                        compartment, [[aa_id]], parameters_by_id=parameters_by_id)
 
                     objects = {
                         wc_lang.Species: all_species,
@@ -688,7 +690,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             n = 1
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                    model, beta, 'translation_init_{}'.format(comp.id), 'translation_init_{}'.format(comp.id), comp, [factor])
+                    model, beta, 'translation_init_{}'.format(comp.id), 'translation_init_{}'.format(comp.id), comp, [factor],
+                    parameters_by_id=parameters_by_id)
 
                 objects = {
                         wc_lang.Species: all_species,
@@ -716,7 +719,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             n = 1
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                    model, beta, 'translation_el_{}'.format(comp.id), 'translation_el_{}'.format(comp.id), comp, [factor])
+                    model, beta, 'translation_el_{}'.format(comp.id), 'translation_el_{}'.format(comp.id), comp, [factor],
+                    parameters_by_id=parameters_by_id)
 
                 objects = {
                         wc_lang.Species: all_species,
@@ -744,7 +748,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             n = 1
             for factor in factors:
                 factor_exp, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                    model, beta, 'translocation_{}'.format(comp.id), 'translocation_{}'.format(comp.id), comp, [factor])
+                    model, beta, 'translocation_{}'.format(comp.id), 'translocation_{}'.format(comp.id), comp, [factor],
+                    parameters_by_id=parameters_by_id)
 
                 objects = {
                         wc_lang.Species: all_species,
@@ -904,7 +909,7 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
                                 factor_exp, all_species, all_parameters, all_volumes, all_observables = \
                                     utils.gen_response_functions(model, beta, 'translation_m', 'translation_m', 
-                                    translation_compartment, [cytosolic_trna_ids])
+                                    translation_compartment, [cytosolic_trna_ids], parameters_by_id=parameters_by_id)
 
                                 added_objects = {
                                     wc_lang.Species: all_species,
@@ -967,7 +972,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             
             other_mets = [['gtp'], ['atp']] + ([['selnp']] if selcys else [])
             expressions, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                model, beta, elongation_reaction.id, 'translation_elongation', translation_compartment, other_mets)
+                model, beta, elongation_reaction.id, 'translation_elongation', translation_compartment, other_mets,
+                parameters_by_id=parameters_by_id)
             expression_terms += expressions
             objects[wc_lang.Species].update(all_species)
             objects[wc_lang.Parameter].update(all_parameters)
@@ -1046,7 +1052,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                     objects[wc_lang.Function][factor_details['function'].id] = factor_details['function']    
 
                 expressions, all_species, all_parameters, all_volumes, all_observables = utils.gen_response_functions(
-                    model, beta, reaction.id, 'translocation', energy_compartment, [[energy_reactant]])
+                    model, beta, reaction.id, 'translocation', energy_compartment, [[energy_reactant]],
+                    parameters_by_id=parameters_by_id)
                 expression_terms += expressions
                 objects[wc_lang.Species].update(all_species)
                 objects[wc_lang.Parameter].update(all_parameters)
@@ -1390,6 +1397,8 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             value=scipy.constants.Avogadro,
             units=unit_registry.parse_units('molecule mol^-1'))       
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         for trna_id in cytosolic_trna_ids:
 
             trna_species_type = model.species_types.get_one(id=trna_id)
@@ -1511,7 +1520,7 @@ class TranslationTranslocationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 # Generate rate law for degradation reaction of imported tRNA
                 rate_law_exp, _ = utils.gen_michaelis_menten_like_rate_law(
                     model, reaction, modifiers=[exosome_species], 
-                    exclude_substrates=[metabolites['h2o']])
+                    exclude_substrates=[metabolites['h2o']], parameters_by_id=parameters_by_id)
                 
                 rate_law = model.rate_laws.create(
                     direction=wc_lang.RateLawDirection.forward,
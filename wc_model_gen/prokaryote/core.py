@@ -42,3 +42,5 @@ class ProkaryoteModelGenerator(wc_model_gen.ModelGenerator):
         version = options.get('version', wc_model_gen.__version__)
         assert(isinstance(version, str) or version is None)
         options['version'] = version
+
+        super().clean_and_validate_options()
@@ -12,6 +12,7 @@
 from wc_onto import onto as wc_ontology
 from wc_utils.util.units import unit_registry
 import wc_model_gen.utils as utils
+import collections
 import scipy.constants
 import wc_model_gen
 import wc_lang
@@ -64,25 +65,24 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             reaction.participants = []
 
             # Adding participants to LHS
-            reaction.participants.add(protein_model.species_coefficients.get_or_create(coefficient=-1))
-            reaction.participants.add(atp.species_coefficients.get_or_create(coefficient=-1))
-            reaction.participants.add(h2o.species_coefficients.get_or_create(coefficient=-(len(seq)-1)))
+            reaction.participants.add(self.get_species_coefficient(protein_model, -1))
+            reaction.participants.add(self.get_species_coefficient(atp, -1))
+            reaction.participants.add(self.get_species_coefficient(h2o, -(len(seq)-1)))
 
             # Adding participants to RHS
-            reaction.participants.add(adp.species_coefficients.get_or_create(coefficient=1))
-            reaction.participants.add(pi.species_coefficients.get_or_create(coefficient=1))
+            reaction.participants.add(self.get_species_coefficient(adp, 1))
+            reaction.participants.add(self.get_species_coefficient(pi, 1))
 
             # The code below should be used as currently tRNAs and AAs are always associated
-            codons = []
-            for start_position in range(0, len(protein_kb.gene.get_seq())-3, 3):
-                codons.append(str(protein_kb.gene.get_seq()[start_position:start_position+3]))
+            gene_seq = str(protein_kb.gene.get_seq())
+            codon_counts = collections.Counter(gene_seq[start_position:start_position+3]
+                                               for start_position in range(0, len(gene_seq)-3, 3))
 
-            for codon in set(codons):
+            for codon, count in codon_counts.items():
                 obs_model_id = 'tRNA_' + codon + '_obs'
                 obs_model = model.observables.get_one(id=obs_model_id)
                 for specie in obs_model.expression.species:
-                    reaction.participants.add(
-                        specie.species_coefficients.get_or_create(coefficient=codons.count(codon)))
+                    reaction.participants.add(self.get_species_coefficient(specie, count))
 
             # for amino_acid, aa in zip(amino_acids, aas):
             #    species = model.species_types.get_one(id=amino_acid).species.get_one(compartment=cytosol)
@@ -94,16 +94,16 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 degradosome_species_type_model = model.species_types.get_one(id=degradosome_kb.species_type.id)
                 degradosome_species_model = degradosome_species_type_model.species.get_one(compartment=cytosol)
 
-                reaction.participants.add(degradosome_species_model.species_coefficients.get_or_create(
-                    coefficient=-1))
-                reaction.participants.add(degradosome_species_model.species_coefficients.get_or_create(
-                    coefficient=1))
+                reaction.participants.add(self.get_species_coefficient(degradosome_species_model, -1))
+                reaction.participants.add(self.get_species_coefficient(degradosome_species_model, 1))
 
     def gen_rate_laws(self):
         """ Generate rate laws for the reactions in the submodel """
 
         model = self.model
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         modifier = model.observables.get_one(id='degrade_protease_obs')
 
         for reaction in self.submodel.reactions:
@@ -111,10 +111,10 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             if modifier_reactant:
                 rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
                     model, reaction, modifiers=[modifier],
-                    modifier_reactants=modifier_reactant)
+                    modifier_reactants=modifier_reactant, parameters_by_id=parameters_by_id)
             else:
                 rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
-                    model, reaction, modifiers=[modifier])
+                    model, reaction, modifiers=[modifier], parameters_by_id=parameters_by_id)
 
             rate_law = model.rate_laws.create(direction=wc_lang.RateLawDirection.forward,
                                               type=None,
@@ -142,8 +142,10 @@ class ProteinDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         for species in modifier.expression.species:
             init_species_counts[species.gen_id()] = species.distribution_init_concentration.mean
 
+        reactions_by_id = {reaction.id: reaction for reaction in self.submodel.reactions}
         proteins_kb = self.knowledge_base.cell.species_types.get(__type=wc_kb.prokaryote.ProteinSpeciesType)
-        for protein_kb, reaction in zip(proteins_kb, self.submodel.reactions):
+        for protein_kb in proteins_kb:
+            reaction = reactions_by_id['degradation_' + protein_kb.id]
 
             protein_reactant = model.species_types.get_one(id=protein_kb.id).species.get_one(compartment=cytosol)
             half_life = protein_kb.properties.get_one(property='half_life').get_value()
@@ -85,12 +85,14 @@ class RnaDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
 
         model = self.model
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         modifier = model.observables.get_one(id='degrade_rnase_obs')
 
         for reaction in self.submodel.reactions:
 
             rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
-                model, reaction, modifiers=[modifier])
+                model, reaction, modifiers=[modifier], parameters_by_id=parameters_by_id)
             
             rate_law = model.rate_laws.create(direction=wc_lang.RateLawDirection.forward,
                                               type=None,
@@ -118,8 +120,10 @@ class RnaDegradationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         for species in modifier.expression.species:
             init_species_counts[species.gen_id()] = species.distribution_init_concentration.mean
 
+        reactions_by_id = {reaction.id: reaction for reaction in self.submodel.reactions}
         rnas_kb = self.knowledge_base.cell.species_types.get(__type=wc_kb.prokaryote.RnaSpeciesType)
-        for rna_kb, reaction in zip(rnas_kb, self.submodel.reactions):
+        for rna_kb in rnas_kb:
+            reaction = reactions_by_id['degradation_' + rna_kb.id]
 
             rna_reactant = model.species_types.get_one(id=rna_kb.id).species.get_one(compartment=cytosol)
             half_life = rna_kb.properties.get_one(property='half_life').get_value()
@@ -10,6 +10,7 @@
 from wc_onto import onto as wc_ontology
 from wc_utils.util.units import unit_registry
 import wc_model_gen.utils as utils
+import collections
 import math
 import numpy
 import scipy.constants
@@ -17,6 +18,10 @@ import wc_model_gen
 import wc_lang
 import wc_kb
 
+BASES = 'TCAG'
+STOP_CODONS = frozenset(['TAG', 'TAA', 'TGA'])
+SENSE_CODONS = tuple(a + b + c for a in BASES for b in BASES for c in BASES if a + b + c not in STOP_CODONS)
+
 
 class TranslationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
     """ Generate translation submodel
@@ -57,9 +62,6 @@ class TranslationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
         for modifier in self._modifiers:
             assert(len(modifier.expression.species) == 1)
 
-        bases = "TCAG"
-        codons = [a + b + c for a in bases for b in bases for c in bases]
-
         proteins_kb = cell.species_types.get(__type=wc_kb.prokaryote.ProteinSpeciesType)
         for idx, protein_kb in enumerate(proteins_kb):
 
@@ -70,68 +72,66 @@ class TranslationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             reaction.participants = []
 
             # Adding participants to LHS
-            reaction.participants.add(gtp.species_coefficients.get_or_create(coefficient=-(n_steps+2)))
-            reaction.participants.add(initiation_factors.species_coefficients.get_or_create(coefficient=-1))
-            reaction.participants.add(elongation_factors.species_coefficients.get_or_create(coefficient=-n_steps))
-            reaction.participants.add(release_factors.species_coefficients.get_or_create(coefficient=-1))
+            reaction.participants.add(self.get_species_coefficient(gtp, -(n_steps+2)))
+            reaction.participants.add(self.get_species_coefficient(initiation_factors, -1))
+            reaction.participants.add(self.get_species_coefficient(elongation_factors, -n_steps))
+            reaction.participants.add(self.get_species_coefficient(release_factors, -1))
 
             # Add tRNAs to LHS
-            for codon in codons:
-                if codon not in ['TAG', 'TAA', 'TGA']: #stop codons
-                    n = 0
-
-                    for base in range(0, len(protein_kb.gene.get_seq()), 3):
-                        n += str(protein_kb.gene.get_seq()[base:base+3]).count(codon)
-
-                    if n > 0:
-                        trna_obs = model.observables.get_one(id='tRNA_'+codon+'_obs')
-                        if trna_obs not in self._modifiers:
-                            self._modifiers.append(trna_obs)
-                        trna = trna_obs.expression.species.get_one(compartment=cytosol)
-
-                        # tRNAs are modifiers
-                        reaction.participants.add(trna.species_coefficients.get_or_create(coefficient=-n))
-                        reaction.participants.add(trna.species_coefficients.get_or_create(coefficient=n))
-
-                        # Add appropiate amino acids
-                        # TODO: add in all AAs
-                        if codon == 'ATG':
-                            aa = model.species_types.get_one(id='met').species.get_one(compartment=cytosol)
-                        elif codon == 'ACT' or codon == 'ACC' or codon == 'ACA' or codon == 'ACG':
-                            aa = model.species_types.get_one(id='thr').species.get_one(compartment=cytosol)
-                        elif codon == 'ATT' or codon == 'ATC' or codon == 'ATA':
-                            aa = model.species_types.get_one(id='ile').species.get_one(compartment=cytosol)
-                        elif codon == 'TTA' or codon == 'TTG' or codon == 'CTT' or codon == 'CTC' or codon == 'CTA' or codon == 'CTG':
-                            aa = model.species_types.get_one(id='leu').species.get_one(compartment=cytosol)
-                        else:
-                            raise ValueError('Unknown codon: {}'.format(codon))
-
-                        reaction.participants.add(aa.species_coefficients.get_or_create(coefficient=-n))
+            gene_seq = str(protein_kb.gene.get_seq())
+            codon_counts = collections.Counter(gene_seq[base:base+3] for base in range(0, len(gene_seq), 3))
+            for codon in SENSE_CODONS:
+                n = codon_counts[codon]
+
+                if n > 0:
+                    trna_obs = model.observables.get_one(id='tRNA_'+codon+'_obs')
+                    if trna_obs not in self._modifiers:
+                        self._modifiers.append(trna_obs)
+                    trna = trna_obs.expression.species.get_one(compartment=cytosol)
+
+                    # tRNAs are modifiers
+                    reaction.participants.add(self.get_species_coefficient(trna, -n))
+                    reaction.participants.add(self.get_species_coefficient(trna, n))
+
+                    # Add appropiate amino acids
+                    # TODO: add in all AAs
+                    if codon == 'ATG':
+                        aa = model.species_types.get_one(id='met').species.get_one(compartment=cytosol)
+                    elif codon == 'ACT' or codon == 'ACC' or codon == 'ACA' or codon == 'ACG':
+                        aa = model.species_types.get_one(id='thr').species.get_one(compartment=cytosol)
+                    elif codon == 'ATT' or codon == 'ATC' or codon == 'ATA':
+                        aa = model.species_types.get_one(id='ile').species.get_one(compartment=cytosol)
+                    elif codon == 'TTA' or codon == 'TTG' or codon == 'CTT' or codon == 'CTC' or codon == 'CTA' or codon == 'CTG':
+                        aa = model.species_types.get_one(id='leu').species.get_one(compartment=cytosol)
+                    else:
+                        raise ValueError('Unknown codon: {}'.format(codon))
+
+                    reaction.participants.add(self.get_species_coefficient(aa, -n))
 
             # Adding participants to RHS
             if protein_model == initiation_factors:
-                reaction.participants.add(initiation_factors.species_coefficients.get_or_create(coefficient=2))
-                reaction.participants.add(elongation_factors.species_coefficients.get_or_create(coefficient=n_steps))
-                reaction.participants.add(release_factors.species_coefficients.get_or_create(coefficient=1))
+                reaction.participants.add(self.get_species_coefficient(initiation_factors, 2))
+                reaction.participants.add(self.get_species_coefficient(elongation_factors, n_steps))
+                reaction.participants.add(self.get_species_coefficient(release_factors, 1))
 
             elif protein_model == elongation_factors:
-                reaction.participants.add(elongation_factors.species_coefficients.get_or_create(coefficient=n_steps+1))
-                reaction.participants.add(initiation_factors.species_coefficients.get_or_create(coefficient=1))
-                reaction.participants.add(release_factors.species_coefficients.get_or_create(coefficient=1))
+                reaction.participants.add(self.get_species_coefficient(elongation_factors, n_steps+1))
+                reaction.participants.add(self.get_species_coefficient(initiation_factors, 1))
+                reaction.participants.add(self.get_species_coefficient(release_factors, 1))
 
             elif protein_model == release_factors:
-                reaction.participants.add(release_factors.species_coefficients.get_or_create(coefficient=2))
-                reaction.participants.add(initiation_factors.species_coefficients.get_or_create(coefficient=1))
-                reaction.participants.add(elongation_factors.species_coefficients.get_or_create(coefficient=n_steps))
+                reaction.participants.add(self.get_species_coefficient(release_factors, 2))
+                reaction.participants.add(self.get_species_coefficient(initiation_factors, 1))
+                reaction.participants.add(self.get_species_coefficient(elongation_factors, n_steps))
 
             else:
-                reaction.participants.add(protein_model.species_coefficients.get_or_create(coefficient=1))
-                reaction.participants.add(initiation_factors.species_coefficients.get_or_create(coefficient=1))
-                reaction.participants.add(elongation_factors.species_coefficients.get_or_create(coefficient=n_steps))
-                reaction.participants.add(release_factors.species_coefficients.get_or_create(coefficient=1))
+                reaction.participants.add(self.get_species_coefficient(protein_model, 1))
+                reaction.participants.add(self.get_species_coefficient(initiation_factors, 1))
+                reaction.participants.add(self.get_species_coefficient(elongation_factors, n_steps))
+                reaction.participants.add(self.get_species_coefficient(release_factors, 1))
 
-            reaction.participants.add(gdp.species_coefficients.get_or_create(coefficient=n_steps+2))
-            reaction.participants.add(pi.species_coefficients.get_or_create(coefficient=2*n_steps))
+            reaction.participants.add(self.get_species_coefficient(gdp, n_steps+2))
+            reaction.participants.add(self.get_species_coefficient(pi, 2*n_steps))
 
             # Add ribosome
             if model.observables.get_one(id='ribosome_obs') not in self._modifiers:
@@ -141,17 +141,19 @@ class TranslationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
                 ribosome_species_type_model = model.species_types.get_one(id=ribosome_kb.species_type.id)
                 ribosome_model = ribosome_species_type_model.species.get_one(compartment=cytosol)
 
-                reaction.participants.add(ribosome_model.species_coefficients.get_or_create(coefficient=-1))
-                reaction.participants.add(ribosome_model.species_coefficients.get_or_create(coefficient=1))
+                reaction.participants.add(self.get_species_coefficient(ribosome_model, -1))
+                reaction.participants.add(self.get_species_coefficient(ribosome_model, 1))
 
 
     def gen_rate_laws(self):
         """ Generate rate laws for the reactions in the submodel """
         model = self.model
 
+        parameters_by_id = {i.id: i for i in model.parameters}
+
         for reaction in self.submodel.reactions:
             rate_law_exp, parameters = utils.gen_michaelis_menten_like_rate_law(
-                model, reaction, modifiers=self._modifiers)
+                model, reaction, modifiers=self._modifiers, parameters_by_id=parameters_by_id)
             
             rate_law = model.rate_laws.create(direction=wc_lang.RateLawDirection.forward,
                                               type=None,
@@ -180,8 +182,10 @@ class TranslationSubmodelGenerator(wc_model_gen.SubmodelGenerator):
             for species in modifier.expression.species:
                 init_species_counts[species.gen_id()] = species.distribution_init_concentration.mean
 
-        protein_kb = self.knowledge_base.cell.species_types.get(__type=wc_kb.prokaryote.ProteinSpeciesType)
-        for protein_kb, reaction in zip(protein_kb, self.submodel.reactions):
+        reactions_by_id = {reaction.id: reaction for reaction in self.submodel.reactions}
+        proteins_kb = self.knowledge_base.cell.species_types.get(__type=wc_kb.prokaryote.ProteinSpeciesType)
+        for protein_kb in proteins_kb:
+            reaction = reactions_by_id['translation_' + protein_kb.id]
 
             protein_product = model.species_types.get_one(id=protein_kb.id).species.get_one(compartment=cytosol)
             half_life = protein_kb.properties.get_one(property='half_life').get_value()
@@ -10,10 +10,26 @@ from wc_onto import onto as wc_ontology
 from wc_utils.util.units import unit_registry
 import collections
 import conv_opt
+import functools
 import math
 import scipy.constants
 import wc_lang
 
+LN2 = math.log(2)
+
+
+@functools.lru_cache(maxsize=None)
+def parse_units(units):
+    """ Parse a units string, reusing the result of previous calls with the same string
+
+        Args:
+            units (:obj:`str`): units
+
+        Returns:
+            :obj:`pint.unit.Unit`: parsed units
+    """
+    return unit_registry.parse_units(units)
+
 
 def calc_avg_syn_rate(mean_concentration, half_life, mean_doubling_time):
     """ Calculate the average synthesis rate of a species over a cell cycle
@@ -26,7 +42,7 @@ def calc_avg_syn_rate(mean_concentration, half_life, mean_doubling_time):
         Returns:
             :obj:`float`: the average synthesis rate of the species
     """
-    ave_synthesis_rate = math.log(2) * (1. / mean_doubling_time + 1. / half_life) * mean_concentration
+    ave_synthesis_rate = LN2 * (1. / mean_doubling_time + 1. / half_life) * mean_concentration
 
     return ave_synthesis_rate
 
@@ -41,7 +57,7 @@ def calc_avg_deg_rate(mean_concentration, half_life):
         Returns:
             :obj:`float`: the average degradation rate of the species
     """
-    ave_degradation_rate = math.log(2) / half_life * mean_concentration
+    ave_degradation_rate = LN2 / half_life * mean_concentration
 
     return ave_degradation_rate
 
@@ -183,7 +199,7 @@ def test_metabolite_production(submodel, reaction_bounds, pseudo_reactions=None,
     return unproducibles, unrecyclables                 
 
 
-def simple_repressor (model, reaction_id, repressor):
+def simple_repressor (model, reaction_id, repressor, parameters_by_id=None):
     """ Generate the parameters and string expression of the regulation factor 
         derived in Bintu et al (2005) for the case of a simple repressor
 
@@ -191,6 +207,10 @@ def simple_repressor (model, reaction_id, repressor):
             model (:obj:`wc_lang.Model`): model
             reaction_id (:obj:`str`): reaction id   
             repressor (:obj:`wc_lang.Species`): repressor
+            parameters_by_id (:obj:`dict`, optional): dict of all of the parameters of the model
+                with the parameter ids as keys and the parameter objects as values; updated in place
+                with the parameters that are created, so that callers that generate many regulation factors
+                can build it once
 
         Returns:
             :obj:`str`: string expression of the regulation factor
@@ -207,17 +227,19 @@ def simple_repressor (model, reaction_id, repressor):
 
     species[repressor.id] = repressor
 
-    avogadro = model.parameters.get_or_create(
-        id='Avogadro',
-        type=None,
-        value=scipy.constants.Avogadro,
-        units=unit_registry.parse_units('molecule mol^-1'))
+    if parameters_by_id is None:
+        parameters_by_id = {i.id: i for i in model.parameters}
+
+    avogadro = _get_or_create_parameter(model, parameters_by_id, 'Avogadro',
+                                        type=None,
+                                        value=scipy.constants.Avogadro,
+                                        units=parse_units('molecule mol^-1'))
     parameters[avogadro.id] = avogadro
 
-    Kr = model.parameters.get_or_create(
-            id='Kr_{}_{}'.format(reaction_id, repressor.species_type.id),
-            type=None,
-            units=unit_registry.parse_units('M'))
+    Kr = _get_or_create_parameter(model, parameters_by_id,
+                                  'Kr_{}_{}'.format(reaction_id, repressor.species_type.id),
+                                  type=None,
+                                  units=parse_units('M'))
     parameters[Kr.id] = Kr
 
     volume = repressor.compartment.init_density.function_expressions[0].function
@@ -228,7 +250,7 @@ def simple_repressor (model, reaction_id, repressor):
     return F_rep, species, parameters, functions
 
 
-def simple_activator (model, reaction_id, activator):
+def simple_activator (model, reaction_id, activator, parameters_by_id=None):
     """ Generate the parameters and string expression of the regulation factor 
         derived in Bintu et al (2005) for the case of a simple activator
 
@@ -236,6 +258,10 @@ def simple_activator (model, reaction_id, activator):
             model (:obj:`wc_lang.Model`): model
             reaction_id (:obj:`str`): reaction id
             activator (:obj:`wc_lang.Species`): activator
+            parameters_by_id (:obj:`dict`, optional): dict of all of the parameters of the model
+                with the parameter ids as keys and the parameter objects as values; updated in place
+                with the parameters that are created, so that callers that generate many regulation factors
+                can build it once
 
         Returns:
             :obj:`str`: string expression of the regulation factor
@@ -252,23 +278,25 @@ def simple_activator (model, reaction_id, activator):
 
     species[activator.id] = activator
 
-    avogadro = model.parameters.get_or_create(
-        id='Avogadro',
-        type=None,
-        value=scipy.constants.Avogadro,
-        units=unit_registry.parse_units('molecule mol^-1'))
+    if parameters_by_id is None:
+        parameters_by_id = {i.id: i for i in model.parameters}
+
+    avogadro = _get_or_create_parameter(model, parameters_by_id, 'Avogadro',
+                                        type=None,
+                                        value=scipy.constants.Avogadro,
+                                        units=parse_units('molecule mol^-1'))
     parameters[avogadro.id] = avogadro
 
-    Ka = model.parameters.get_or_create(
-        id='Ka_{}_{}'.format(reaction_id, activator.species_type.id),
-        type=None,
-        units=unit_registry.parse_units('M'))
+    Ka = _get_or_create_parameter(model, parameters_by_id,
+                                  'Ka_{}_{}'.format(reaction_id, activator.species_type.id),
+                                  type=None,
+                                  units=parse_units('M'))
     parameters[Ka.id] = Ka
     
-    f = model.parameters.get_or_create(
-        id='f_{}_{}'.format(reaction_id, activator.species_type.id),
-        type=None,
-        units=unit_registry.parse_units(''))
+    f = _get_or_create_parameter(model, parameters_by_id,
+                                 'f_{}_{}'.format(reaction_id, activator.species_type.id),
+                                 type=None,
+                                 units=parse_units(''))
     parameters[f.id] = f
 
     volume = activator.compartment.init_density.function_expressions[0].function
@@ -280,7 +308,8 @@ def simple_activator (model, reaction_id, activator):
     return F_act, species, parameters, functions
 
 
-def gen_michaelis_menten_like_rate_law(model, reaction, modifiers=None, modifier_reactants=None, exclude_substrates=None):
+def gen_michaelis_menten_like_rate_law(model, reaction, modifiers=None, modifier_reactants=None, exclude_substrates=None,
+                                       parameters_by_id=None):
     """ Generate a Michaelis-Menten-like rate law. For a multi-substrate reaction,  
         the substrate term is formulated as the multiplication of a Hill equation
         with a coefficient of 1 for each substrate. For multi-steps reaction where
@@ -308,89 +337,88 @@ def gen_michaelis_menten_like_rate_law(model, reaction, modifiers=None, modifier
                 in modifiers that should be included as reactants in the rate law 
             exclude_substrates (:obj:`list` of :obj:`wc_lang.Species`): list of reactant species 
                 that would be excluded from the rate law       
+            parameters_by_id (:obj:`dict`, optional): dict of all of the parameters of the model
+                with the parameter ids as keys and the parameter objects as values; updated in place
+                with the parameters that are created, so that callers that generate many rate laws
+                can build it once
 
         Returns:
                 :obj:`wc_lang.RateLawExpression`: rate law
                 :obj:`list` of :obj:`wc_lang.Parameter`: list of parameters in the rate law     
     """
-    modifier_species = []
+    modifier_species = set()
+    modifier_ids = []
     all_species = {}
-    all_volumes = {}
     all_observables = {}
     all_parameters = {}
+    volumes = {}
     if modifiers:
         for modifier in modifiers:
             if type(modifier) == wc_lang.Observable:
                 all_observables[modifier.id] = modifier
-                for species in modifier.expression.species:
-                    modifier_species.append(species)                    
+                modifier_ids.append(modifier.id)
+                modifier_species.update(modifier.expression.species)
             elif type(modifier) == wc_lang.Species:
-                modifier_species.append(modifier)
-                all_species[modifier.gen_id()] = modifier
+                modifier_species.add(modifier)
+                modifier_id = modifier.gen_id()
+                all_species[modifier_id] = modifier
+                modifier_ids.append(modifier_id)
             else:
                 raise TypeError('The modifiers contain element(s) that is not an observable or a species')          
 
     if modifier_reactants is None:
-        additional_reactants = []
+        additional_reactants = set()
     else:
-        additional_reactants = modifier_reactants
+        additional_reactants = set(modifier_reactants)
 
     if exclude_substrates:
-        excluded_reactants = exclude_substrates
+        excluded_reactants = set(exclude_substrates)
     else:
-        excluded_reactants = []    
+        excluded_reactants = set()
 
-    avogadro = model.parameters.get_or_create(
-        id='Avogadro',
-        type=None,
-        value=scipy.constants.Avogadro,
-        units=unit_registry.parse_units('molecule mol^-1'))
+    if parameters_by_id is None:
+        parameters_by_id = {i.id: i for i in model.parameters}
+
+    avogadro = _get_or_create_parameter(model, parameters_by_id, 'Avogadro',
+                                        type=None,
+                                        value=scipy.constants.Avogadro,
+                                        units=parse_units('molecule mol^-1'))
     all_parameters[avogadro.id] = avogadro
 
-    model_k_cat = model.parameters.get_or_create(id='k_cat_{}'.format(reaction.id),
-                                                 type=wc_ontology['WC:k_cat'],
-                                                 units=unit_registry.parse_units('s^-1{}'.format(
-                                                (' * molecule^{{-{}}}'.format(len(modifiers))) if modifiers else '')))
+    model_k_cat = _get_or_create_k_cat(model, parameters_by_id, reaction, len(modifiers) if modifiers else 0)
     all_parameters[model_k_cat.id] = model_k_cat
 
+    k_m_type = wc_ontology['WC:K_m']
+    k_m_units = parse_units('M')
     expression_terms = []    
     for species in reaction.get_reactants():
 
         if (species not in modifier_species or species in additional_reactants) and species not in excluded_reactants:
 
-            all_species[species.gen_id()] = species
+            species_id = species.gen_id()
+            all_species[species_id] = species
 
-            model_k_m = model.parameters.get_or_create(id='K_m_{}_{}'.format(reaction.id, species.species_type.id),
-                                                type=wc_ontology['WC:K_m'],
-                                                units=unit_registry.parse_units('M'))
+            k_m_id = 'K_m_{}_{}'.format(reaction.id, species.species_type.id)
+            model_k_m = _get_or_create_parameter(model, parameters_by_id, k_m_id, type=k_m_type, units=k_m_units)
             all_parameters[model_k_m.id] = model_k_m
 
-            volume = species.compartment.init_density.function_expressions[0].function
-            all_volumes[volume.id] = volume
+            volume = _get_volume(species.compartment, volumes)
 
-            expression_terms.append('({} / ({} + {} * {} * {}))'.format(species.gen_id(),
-                                                                        species.gen_id(),
+            expression_terms.append('({} / ({} + {} * {} * {}))'.format(species_id,
+                                                                        species_id,
                                                                         model_k_m.id, avogadro.id,
                                                                         volume.id))
 
     expression = '{}{}{}'.format(
         model_k_cat.id,
-        (' * {}'.format(' * '.join([i.id if type(i)==wc_lang.Observable else i.gen_id() \
-            for i in modifiers]))) if modifiers else '',
+        (' * {}'.format(' * '.join(modifier_ids))) if modifier_ids else '',
         (' * {}'.format(' * '.join(expression_terms))) if expression_terms else '')
     
-    rate_law_expression, error = wc_lang.RateLawExpression.deserialize(expression, {
-        wc_lang.Parameter: all_parameters,
-        wc_lang.Species: all_species,
-        wc_lang.Observable: all_observables,
-        wc_lang.Function: all_volumes,
-    })
-    assert error is None, str(error)
-
-    return rate_law_expression, list(all_parameters.values())
+    return _deserialize_rate_law(expression, all_parameters, all_species, all_observables, volumes)
 
 
-def gen_michaelis_menten_like_propensity_function(model, reaction, substrates_as_modifiers=None, exclude_substrates=None):
+def gen_michaelis_menten_like_propensity_function(model, reaction, substrates_as_modifiers=None, exclude_substrates=None,
+                                                  parameters_by_id=None):
     """ Generate a Michaelis-Menten-like propensity function. 
         For species that are considered 'substrates', the substrate term is formulated as the 
         multiplication of a Hill equation with a coefficient of 1 for each 'substrate'. 
@@ -414,6 +442,10 @@ def gen_michaelis_menten_like_propensity_function(model, reaction, substrates_as
                 that should be considered as modifiers in the rate law
             exclude_substrates (:obj:`list` of :obj:`wc_lang.Species`): list of reactant species 
                 that would be excluded from the rate law        
+            parameters_by_id (:obj:`dict`, optional): dict of all of the parameters of the model
+                with the parameter ids as keys and the parameter objects as values; updated in place
+                with the parameters that are created, so that callers that generate many propensity functions
+                can build it once
 
         Returns:
                 :obj:`wc_lang.RateLawExpression`: rate law
@@ -423,45 +455,44 @@ def gen_michaelis_menten_like_propensity_function(model, reaction, substrates_as
         raise ValueError('No list has been provided for the input argument substrates_as_modifiers')
 
     if exclude_substrates:
-        excluded_reactants = exclude_substrates
+        excluded_reactants = set(exclude_substrates)
     else:
-        excluded_reactants = []        
+        excluded_reactants = set()
     
     parameters = {}
 
-    avogadro = model.parameters.get_or_create(
-        id='Avogadro',
-        type=None,
-        value=scipy.constants.Avogadro,
-        units=unit_registry.parse_units('molecule mol^-1'))
+    if parameters_by_id is None:
+        parameters_by_id = {i.id: i for i in model.parameters}
+
+    avogadro = _get_or_create_parameter(model, parameters_by_id, 'Avogadro',
+                                        type=None,
+                                        value=scipy.constants.Avogadro,
+                                        units=parse_units('molecule mol^-1'))
     parameters[avogadro.id] = avogadro
 
-    model_k_cat = model.parameters.get_or_create(id='k_cat_{}'.format(reaction.id),
-                                                 type=wc_ontology['WC:k_cat'],
-                                                 units=unit_registry.parse_units('s^-1{}'.format(
-                                                    (' * molecule^{{-{}}}'.format(
-                                                    len(substrates_as_modifiers))))))
+    model_k_cat = _get_or_create_k_cat(model, parameters_by_id, reaction, len(substrates_as_modifiers))
     parameters[model_k_cat.id] = model_k_cat
 
+    k_m_type = wc_ontology['WC:K_m']
+    k_m_units = parse_units('M')
     expression_terms = []
     all_species = {}
-    all_volumes = {}
+    volumes = {}
     for species in reaction.get_reactants():
 
-        all_species[species.gen_id()] = species
+        species_id = species.gen_id()
+        all_species[species_id] = species
 
         if species not in substrates_as_modifiers and species not in excluded_reactants:            
 
-            model_k_m = model.parameters.get_or_create(id='K_m_{}_{}'.format(reaction.id, species.species_type.id),
-                                                type=wc_ontology['WC:K_m'],
-                                                units=unit_registry.parse_units('M'))
+            k_m_id = 'K_m_{}_{}'.format(reaction.id, species.species_type.id)
+            model_k_m = _get_or_create_parameter(model, parameters_by_id, k_m_id, type=k_m_type, units=k_m_units)
             parameters[model_k_m.id] = model_k_m
 
-            volume = species.compartment.init_density.function_expressions[0].function
-            all_volumes[volume.id] = volume
+            volume = _get_volume(species.compartment, volumes)
 
-            expression_terms.append('({} / ({} + {} * {} * {}))'.format(species.gen_id(),
-                                                                        species.gen_id(),
+            expression_terms.append('({} / ({} + {} * {} * {}))'.format(species_id,
+                                                                        species_id,
                                                                         model_k_m.id, avogadro.id,
                                                                         volume.id))
 
@@ -470,16 +501,10 @@ def gen_michaelis_menten_like_propensity_function(model, reaction, substrates_as
         (' * {}'.format(' * '.join([i.id for i in substrates_as_modifiers]))),
         (' * {}'.format(' * '.join(expression_terms))))
 
-    rate_law_expression, error = wc_lang.RateLawExpression.deserialize(expression, {
-        wc_lang.Parameter: parameters,
-        wc_lang.Species: all_species,
-        wc_lang.Function: all_volumes,
-    })
-    assert error is None, str(error)
-
-    return rate_law_expression, list(parameters.values())    
+    return _deserialize_rate_law(expression, parameters, all_species, {}, volumes)
 
-def gen_response_functions(model, beta, reaction_id, reaction_class, compartment, reaction_factors):
+def gen_response_functions(model, beta, reaction_id, reaction_class, compartment, reaction_factors,
+                           parameters_by_id=None):
         """ Generate a list of response function expression string for each factor or 
             group of factors (F) in the form of:
                        
@@ -497,6 +522,10 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
             reaction_factors (:obj:`list` of `list`): list of lists of the ID or name of
                 (initiation/elongation/translocation) factors, grouped based on similar functions or classes,
                 e.g. [['factor1 variant1', 'factor1 variant2'], ['factor2']]
+                parameters_by_id (:obj:`dict`, optional): dict of all of the parameters of the model
+                    with the parameter ids as keys and the parameter objects as values; updated in place
+                    with the parameters that are created, so that callers that generate many response functions
+                    can build it once
             
         Returns:
             :obj:`list`: list of strings of response function expression for each factor/group of factors
@@ -511,16 +540,20 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
         all_volumes = {}
         all_observables = {}
 
-        Avogadro = model.parameters.get_or_create(
-            id='Avogadro',
-            type=None,
-            value=scipy.constants.Avogadro,
-            units=unit_registry.parse_units('molecule mol^-1'))
+        if parameters_by_id is None:
+            parameters_by_id = {i.id: i for i in model.parameters}
+
+        Avogadro = _get_or_create_parameter(model, parameters_by_id, 'Avogadro',
+                                            type=None,
+                                            value=scipy.constants.Avogadro,
+                                            units=parse_units('molecule mol^-1'))
         all_parameters[Avogadro.id] = Avogadro
 
         volume = compartment.init_density.function_expressions[0].function
         all_volumes[volume.id] = volume
 
+        k_m_type = wc_ontology['WC:K_m']
+        k_m_units = parse_units('M')
         factor_exp = []
         for factors in reaction_factors:
             
@@ -530,14 +563,15 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
                 if not factor_species_type:
                     factor_species_type = model.species_types.get_one(id=factors[0])
                 factor_species = factor_species_type.species.get_one(compartment=compartment)                
-                all_species[factor_species.gen_id()] = factor_species
+                factor_species_id = factor_species.gen_id()
+                all_species[factor_species_id] = factor_species
 
-                model_k_m = model.parameters.get_or_create(
-                    id='K_m_{}_{}'.format(reaction_id, factor_species.species_type.id),
+                model_k_m = _get_or_create_parameter(model, parameters_by_id,
+                    'K_m_{}_{}'.format(reaction_id, factor_species.species_type.id),
                     value = beta * factor_species.distribution_init_concentration.mean \
                         / Avogadro.value / compartment.init_volume.mean,
-                    type=wc_ontology['WC:K_m'],
-                    units=unit_registry.parse_units('M'),
+                    type=k_m_type,
+                    units=k_m_units,
                     comments = 'The value was assumed to be {} times the concentration of {} in {}'.format(
                         beta, factor_species_type.id, compartment.name)
                     )
@@ -548,8 +582,8 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
                 all_parameters[model_k_m.id] = model_k_m                    
 
                 factor_exp.append('({} / ({} + {} * {} * {}))'.format(
-                    factor_species.gen_id(),
-                    factor_species.gen_id(),
+                    factor_species_id,
+                    factor_species_id,
                     model_k_m.id, 
                     Avogadro.id,
                     volume.id))
@@ -563,8 +597,9 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
                     if not factor_species_type:
                         factor_species_type = model.species_types.get_one(id=factor)
                     factor_species = factor_species_type.species.get_one(compartment=compartment)
-                    all_species[factor_species.gen_id()] = factor_species
-                    obs_exp.append(factor_species.gen_id())
+                    factor_species_id = factor_species.gen_id()
+                    all_species[factor_species_id] = factor_species
+                    obs_exp.append(factor_species_id)
                     obs_total += factor_species.distribution_init_concentration.mean
                     obs_exp_string = ' + '.join(sorted(obs_exp))
                 
@@ -580,18 +615,18 @@ def gen_response_functions(model, beta, reaction_id, reaction_class, compartment
                     factor_observable = model.observables.get_or_create(
                         id='{}_factors_{}_{}'.format(reaction_class, compartment.id, n+1), 
                         name='factor for {} in {}'.format(reaction_class, compartment.name), 
-                        units=unit_registry.parse_units('molecule'), 
+                        units=parse_units('molecule'), 
                         expression=observable_exp)
                     all_observables[factor_observable.id] = factor_observable
                 else:
                     factor_observable = [i for i in model.observables if i.expression.expression==obs_exp_string][0]
                     all_observables[factor_observable.id] = factor_observable
 
-                model_k_m = model.parameters.get_or_create(
-                    id='K_m_{}_{}'.format(reaction_class, factor_observable.id),
+                model_k_m = _get_or_create_parameter(model, parameters_by_id,
+                    'K_m_{}_{}'.format(reaction_class, factor_observable.id),
                     value = beta * obs_total / Avogadro.value / compartment.init_volume.mean,
-                    type=wc_ontology['WC:K_m'],
-                    units=unit_registry.parse_units('M'),
+                    type=k_m_type,
+                    units=k_m_units,
                     comments = 'The value was assumed to be {} times the value of {}'.format(
                         beta, factor_observable.id)  
                     )
@@ -637,22 +672,29 @@ def gen_mass_action_rate_law(model, reaction, model_k, modifiers=None, modifier_
    """
     
     if modifiers is None:
-        modifier_species = []
+        modifier_species = set()
         modifier_product = ''
-        modifier_ids = None
+        modifier_ids = {}
     else:
-        modifier_species = [i for modifier in modifiers for i in modifier.expression.species]
+        modifier_species = {i for modifier in modifiers for i in modifier.expression.species}
         modifier_product = ' * ' + ' * '.join([i.id for i in modifiers])
         modifier_ids = {i.id: i for i in modifiers}
 
     if modifier_reactants is None:
-        additional_reactants = []
+        additional_reactants = set()
     else:
-        additional_reactants = modifier_reactants
+        additional_reactants = set(modifier_reactants)
 
     parameters = {}
+
+    reactants = reaction.get_reactants()
+
+    # classify the participants in a single pass, in the order in which they appear in the reaction
+    participants = dict.fromkeys(reactants, True)
+    for species in reaction.get_products():
+        participants.setdefault(species, False)
     
-    model_k_unit = len(reaction.get_reactants())-1
+    model_k_unit = len(reactants)-1
     if model_k_unit == 0:
         model_k_unit = 's^-1'
     elif model_k_unit == -1:
@@ -660,32 +702,121 @@ def gen_mass_action_rate_law(model, reaction, model_k, modifiers=None, modifier_
     else:
         model_k_unit = 's^-1 * molecule^{}'.format(-model_k_unit)
     
-    model_k.units = unit_registry.parse_units(model_k_unit)
+    model_k_units = parse_units(model_k_unit)
+    if model_k.units != model_k_units:
+        model_k.units = model_k_units
 
     parameters[model_k.id] = model_k
 
     expression_terms = []
     all_species = {}
-    all_volumes = {}    
-    for species in set(reaction.get_reactants()).union(set(reaction.get_products())):
+    volumes = {}
+    for species, is_reactant in participants.items():
+        species_id = species.gen_id()
         if species not in modifier_species or species in additional_reactants:
-            all_species[species.gen_id()] = species
-            volume = species.compartment.init_density.function_expressions[0].function
-            all_volumes[volume.id] = volume
-        if species in set(reaction.get_reactants()):
-            expression_terms.append(str(species.gen_id()))
+            all_species[species_id] = species
+            _get_volume(species.compartment, volumes)
+        if is_reactant:
+            expression_terms.append(species_id)
     
     reactant_product = ''
     if expression_terms:
         reactant_product = ' * ' + ' * '.join(expression_terms)
     expression = model_k.id + modifier_product + reactant_product
     
+    return _deserialize_rate_law(expression, parameters, all_species, modifier_ids, volumes)
+
+
+def _get_or_create_parameter(model, parameters_by_id, id, **kwargs):
+    """ Get a parameter of a model by its id, or create it if the model doesn't have it yet
+
+        Args:
+            model (:obj:`wc_lang.Model`): model
+            parameters_by_id (:obj:`dict`): dict of the parameters of the model with the parameter ids
+                as keys and the parameter objects as values; updated in place
+            id (:obj:`str`): id of the parameter
+            **kwargs: attributes that are assigned to the parameter if it is created
+
+        Returns:
+            :obj:`wc_lang.Parameter`: parameter
+    """
+    parameter = parameters_by_id.get(id)
+    if parameter is None:
+        parameter = parameters_by_id[id] = model.parameters.create(id=id, **kwargs)
+    return parameter
+
+
+def _get_or_create_k_cat(model, parameters_by_id, reaction, n_modifiers):
+    """ Get or create the catalytic constant of a reaction, with units that match the number of modifiers
+        in its rate law
+
+        An existing catalytic constant with other units is left unchanged, because rate laws that were
+        generated earlier may use it. As with :obj:`obj_model.RelatedManager.get_or_create`, a catalytic
+        constant with the same id and the required units is returned or created instead.
+
+        Args:
+            model (:obj:`wc_lang.Model`): model
+            parameters_by_id (:obj:`dict`): dict of the parameters of the model with the parameter ids
+                as keys and the parameter objects as values; updated in place
+            reaction (:obj:`wc_lang.Reaction`): reaction
+            n_modifiers (:obj:`int`): number of modifiers in the rate law
+
+        Returns:
+            :obj:`wc_lang.Parameter`: catalytic constant
+    """
+    k_cat_id = 'k_cat_{}'.format(reaction.id)
+    k_cat_type = wc_ontology['WC:k_cat']
+    k_cat_units = parse_units('s^-1{}'.format(
+        (' * molecule^{{-{}}}'.format(n_modifiers)) if n_modifiers else ''))
+    model_k_cat = _get_or_create_parameter(model, parameters_by_id, k_cat_id,
+                                           type=k_cat_type,
+                                           units=k_cat_units)
+    if model_k_cat.type != k_cat_type or model_k_cat.units != k_cat_units:
+        model_k_cat = model.parameters.get_or_create(id=k_cat_id, type=k_cat_type, units=k_cat_units)
+    return model_k_cat
+
+
+def _get_volume(compartment, volumes):
+    """ Get the function for the volume of a compartment, resolving it only once per rate law
+
+        Args:
+            compartment (:obj:`wc_lang.Compartment`): compartment
+            volumes (:obj:`dict`): dict of the volume functions resolved so far, with
+                compartments as keys and volume functions as values; updated in place
+
+        Returns:
+            :obj:`wc_lang.Function`: volume function of the compartment
+    """
+    volume = volumes.get(compartment)
+    if volume is None:
+        volume = volumes[compartment] = compartment.init_density.function_expressions[0].function
+    return volume
+
+
+def _deserialize_rate_law(expression, parameters, species, observables, volumes):
+    """ Deserialize the string expression of a rate law generated by one of the rate law generators
+
+        Args:
+            expression (:obj:`str`): string expression of the rate law
+            parameters (:obj:`dict`): dict of parameters in the expression with the parameter ids
+                as keys and the parameter objects as values
+            species (:obj:`dict`): dict of species in the expression with the species ids
+                as keys and the species objects as values
+            observables (:obj:`dict`): dict of observables in the expression with the observable ids
+                as keys and the observable objects as values
+            volumes (:obj:`dict`): dict of volume functions in the expression with
+                compartments as keys and volume functions as values
+
+        Returns:
+            :obj:`wc_lang.RateLawExpression`: rate law
+            :obj:`list` of :obj:`wc_lang.Parameter`: list of parameters in the rate law
+    """
     rate_law_expression, error = wc_lang.RateLawExpression.deserialize(expression, {
         wc_lang.Parameter: parameters,
-        wc_lang.Species: all_species,
-        wc_lang.Observable: {i.id: i for i in modifiers} if modifiers else {},
-        wc_lang.Function: all_volumes,
+        wc_lang.Species: species,
+        wc_lang.Observable: observables,
+        wc_lang.Function: {volume.id: volume for volume in volumes.values()},
     })
     assert error is None, str(error)
-    
+
     return rate_law_expression, list(parameters.values())